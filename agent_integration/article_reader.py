@@ -3,12 +3,24 @@ Enhanced Offline Article Reader Agent for Robotics Radar.
 Reads article content from URLs and generates intelligent summaries.
 """
 
+import asyncio
+import codecs
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
+import heapq
 import logging
 import re
-from typing import Optional, Dict, List
-from bs4 import BeautifulSoup
+from typing import Optional, Dict, List, Iterable, Iterator, Set
+import lxml.html
+from lxml import etree
 import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from urllib.parse import urlparse
 import sys
 import os
@@ -22,166 +34,526 @@ from nlp.keyword_extraction import KeywordExtractor
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Optional HTTP cache: follows the server's Cache-Control/Expires, and re-fetches
+# of pages with an ETag become conditional GETs
+try:
+    from cachecontrol import CacheControlAdapter
+    from cachecontrol.caches.file_cache import FileCache
+    from cachecontrol.heuristics import ExpiresAfter
+except ImportError:
+    CacheControlAdapter = None
+else:
+    class _ExpiresAfterIfUncacheable(ExpiresAfter):
+        """ExpiresAfter for responses carrying no validator and no caching headers.
+        
+        Responses with any of CACHE_POLICY_HEADERS keep the server's policy, so
+        no-cache/max-age=0 pages are not pinned and ETag pages still revalidate.
+        """
+        
+        CACHE_POLICY_HEADERS = ('etag', 'last-modified', 'cache-control', 'expires')
+        
+        def update_headers(self, response):
+            if any(header in response.headers for header in self.CACHE_POLICY_HEADERS):
+                return {}
+            return super().update_headers(response)
+
+# Only advertise brotli when urllib3 can decode it
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# Optional charset detector for pages that declare no encoding and are not UTF-8
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+# Optional C-based multi-keyword matcher; plain substring scans are used without it
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+ARTICLE_CACHE_DIR = os.getenv('ARTICLE_CACHE_DIR', 'data/article_cache')
+ARTICLE_CACHE_HOURS = 6
+
+# Batch fetching: concurrent workers and minimum delay between requests to the same host
+BATCH_MAX_WORKERS = 8
+HOST_MIN_INTERVAL = 1.0
+
+# Maximum number of articles read_articles_async fetches at once
+ASYNC_MAX_CONCURRENCY = 32
+
+# Connection pooling: keep-alive pools for this many hosts, with room for every
+# concurrent reader so no connection is discarded after use
+HTTP_POOL_HOSTS = 64
+HTTP_POOL_MAXSIZE = max(BATCH_MAX_WORKERS, ASYNC_MAX_CONCURRENCY)
+
+# Upper bound on downloaded HTML per article
+MAX_ARTICLE_BYTES = 2_000_000
+
+# (connect, read) timeouts in seconds; unreachable hosts fail fast
+HTTP_TIMEOUT = (5, 15)
+
+# Responses with any other declared Content-Type are not downloaded
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Number of distinct article bodies whose topics are memoized per process
+TOPIC_CACHE_SIZE = 512
+
+# Derived fields read_article computes when no subset is requested
+ANALYSIS_FIELDS = frozenset({'summary', 'insights', 'topics'})
+
+# Number of analysed articles kept per reader, keyed by URL and body hash
+ARTICLE_RESULT_CACHE_SIZE = 256
+
+# Caption/boilerplate prefixes and precompiled text patterns
+METADATA_PREFIXES = (
+    'source:', 'credit:', 'image:', 'photo:', 'picture:', 'a computer-generated', 'ai-generated',
+    'this image shows', 'the image depicts', 'click here', 'read more', 'share this', 'follow us',
+    'subscribe', 'newsletter'
+)
+METADATA_PREFIX_LEN = max(len(prefix) for prefix in METADATA_PREFIXES)
+CAPTION_RE = re.compile(r'(?:Source|Credit|Image):\s*[^.]*\.')
+SENTENCE_RE = re.compile(r'[^.!?]+')
+HEADER_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+CHARSET_SNIFF_BYTES = 65536
+HTML_PARSER_OPTIONS = {'remove_comments': True, 'remove_pis': True, 'no_network': True}
+# Insights are '.'-delimited segments mentioning any of these phrases
+INSIGHT_SEGMENT_RE = re.compile(r'[^.]+')
+INSIGHT_KEYWORDS = (
+    'breakthrough', 'innovation', 'discovery', 'advancement', 'milestone',
+    'enables', 'allows', 'improves', 'enhances', 'reduces',
+    'first time', 'never before', 'revolutionary', 'game-changing',
+    'cost', 'efficiency', 'accuracy', 'speed', 'performance',
+)
+
+# Compiled XPath queries over the lxml tree
+UNWANTED_TAGS = ('script', 'style', 'nav', 'header', 'footer', 'aside', 'form', 'button')
+UNWANTED_ATTR_PATTERN = (
+    'comment|related|sidebar|advertisement|social|share|'
+    'menu|navigation|footer|header|cookie|popup'
+)
+UNWANTED_ATTR_XPATH = etree.XPath(
+    f"//*[re:test(@class, '{UNWANTED_ATTR_PATTERN}', 'i') or re:test(@id, '{UNWANTED_ATTR_PATTERN}', 'i')]",
+    namespaces={'re': 'http://exslt.org/regular-expressions'}
+)
+# Union of article container selectors; matches are returned once, in document order
+ARTICLE_XPATH = etree.XPath(
+    "//article | //main | //*[contains(@class, 'article') or contains(@class, 'content') "
+    "or contains(@class, 'post') or contains(@class, 'entry')]"
+)
+# Title and meta description candidates are collected in one walk each, then
+# ranked by the predicates below (highest priority first)
+TITLE_CANDIDATES_XPATH = etree.XPath(
+    "//h1 | //title | //*[contains(@class, 'title') or contains(@class, 'headline')] "
+    "| //meta[@property='og:title' or @name='twitter:title']"
+)
+TITLE_PRIORITIES = (
+    lambda element: element.tag == 'h1',
+    lambda element: element.tag == 'title',
+    lambda element: 'title' in element.get('class', ''),
+    lambda element: 'headline' in element.get('class', ''),
+    lambda element: element.tag == 'meta' and element.get('property') == 'og:title',
+    lambda element: element.tag == 'meta' and element.get('name') == 'twitter:title',
+)
+META_DESCRIPTION_XPATH = etree.XPath(
+    "//meta[@name='description' or @property='og:description' or @name='twitter:description']"
+)
+META_DESCRIPTION_PRIORITIES = (
+    lambda element: element.get('name') == 'description',
+    lambda element: element.get('property') == 'og:description',
+    lambda element: element.get('name') == 'twitter:description',
+)
+BODY_TEXT_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'blockquote')
+LINK_COUNT_XPATH = etree.XPath('count(.//a)')
+
+# Lowercase class-name fragments that mark a paragraph as article body
+CONTENT_CLASS_HINTS = ('content', 'article', 'post', 'text')
+
+# Only the leading sentences of an article are scored for the summary
+SUMMARY_MAX_SENTENCES = 10
+
+# Sentence scoring weights: robotics keywords count double, general technical terms once
+SUMMARY_KEYWORD_WEIGHTS = {
+    'robot': 2, 'robotics': 2, 'ai': 2, 'artificial intelligence': 2, 'automation': 2,
+    'machine learning': 2, 'computer vision': 2, 'autonomous': 2, 'sensor': 2, 'algorithm': 2,
+    'system': 1, 'technology': 1, 'development': 1, 'research': 1, 'study': 1, 'experiment': 1
+}
+
+# Summary emoji by content keywords, checked in priority order
+CONTENT_EMOJI_KEYWORDS = [
+    ('🚀', ('breakthrough', 'novel', 'revolutionary', 'first')),
+    ('🔬', ('research', 'study', 'experiment', 'paper')),
+    ('📢', ('announcement', 'launch', 'release')),
+    ('⚡', ('improvement', 'better', 'faster', 'enhanced')),
+]
+EMOJI_KEYWORDS = {keyword for _, keywords in CONTENT_EMOJI_KEYWORDS for keyword in keywords}
+
+
+def _build_keyword_automaton(keywords: Iterable[str]):
+    """Build an Aho-Corasick automaton over keywords, or None without pyahocorasick or keywords."""
+    keywords = list(keywords)
+    if ahocorasick is None or not keywords:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _element_text(element, separator: str = '') -> str:
+    """Join an element's stripped text fragments, like BeautifulSoup's get_text(strip=True)."""
+    return separator.join(text for text in map(str.strip, element.itertext()) if text)
+
+
+def _sniff_charset(html: bytes) -> str:
+    """Guess the encoding of an undeclared page: UTF-8 if it decodes, else ask charset_normalizer."""
+    try:
+        # final=False tolerates a multibyte sequence cut off by MAX_ARTICLE_BYTES truncation
+        codecs.getincrementaldecoder('utf-8')().decode(html, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    if charset_normalizer is not None:
+        best = charset_normalizer.from_bytes(html[:CHARSET_SNIFF_BYTES]).best()
+        if best is not None:
+            return best.encoding
+    return 'utf-8'
+
+
+def _first_matches(elements: Iterable, predicates) -> List:
+    """For each predicate, return the first element (in document order) satisfying it, or None."""
+    firsts = [None] * len(predicates)
+    for element in elements:
+        for i, predicate in enumerate(predicates):
+            if firsts[i] is None and predicate(element):
+                firsts[i] = element
+    return firsts
+
+
+def _find_keywords(text_lower: str, keywords: Iterable[str], automaton) -> Set[str]:
+    """Return the keywords occurring as substrings of text_lower in a single pass."""
+    if automaton is None:
+        return {keyword for keyword in keywords if keyword in text_lower}
+    return {keyword for _, keyword in automaton.iter(text_lower)}
+
+
+def _has_keyword(text_lower: str, keywords: Iterable[str], automaton) -> bool:
+    """Return True as soon as any keyword occurs as a substring of text_lower."""
+    if automaton is None:
+        return any(keyword in text_lower for keyword in keywords)
+    return next(automaton.iter(text_lower), None) is not None
+
+
+@lru_cache(maxsize=None)
+def _shared_keyword_extractor() -> KeywordExtractor:
+    """Load the spaCy-backed keyword extractor once per process."""
+    return KeywordExtractor()
+
+
+# Topics per content digest, shared by all readers; keyed on a 16-byte hash so the
+# cache never pins article bodies (up to MAX_ARTICLE_BYTES each) in memory
+_topic_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+_topic_cache_lock = threading.Lock()
+
+
+def _topics_for_content(content: str) -> tuple:
+    """Topic extraction shared by all readers; returns a tuple so cached results stay immutable."""
+    digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+    with _topic_cache_lock:
+        topics = _topic_cache.get(digest)
+        if topics is not None:
+            _topic_cache.move_to_end(digest)
+            return topics
+    
+    topics = tuple(_shared_keyword_extractor().extract_topics(content))
+    with _topic_cache_lock:
+        _topic_cache[digest] = topics
+        if len(_topic_cache) > TOPIC_CACHE_SIZE:
+            _topic_cache.popitem(last=False)
+    return topics
+
+
+SUMMARY_KEYWORD_AUTOMATON = _build_keyword_automaton(SUMMARY_KEYWORD_WEIGHTS)
+INSIGHT_KEYWORD_AUTOMATON = _build_keyword_automaton(INSIGHT_KEYWORDS)
+EMOJI_KEYWORD_AUTOMATON = _build_keyword_automaton(EMOJI_KEYWORDS)
+
 class ArticleReader:
     """Enhanced offline agent for reading and summarizing articles."""
     
     def __init__(self):
         """Initialize the article reader."""
-        self.keyword_extractor = KeywordExtractor()
+        self.keyword_extractor = _shared_keyword_extractor()
         self.session = requests.Session()
+        adapter = self._create_http_adapter()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
         
-    def read_article(self, url: str) -> Optional[Dict]:
-        """Read and analyze an article from a URL."""
+        # Per-host rate limiting state (shared across batch worker threads)
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._host_last_request: Dict[str, float] = {}
+        self._host_locks_guard = threading.Lock()
+        
+        # Analysed articles by (url, body digest): an unchanged body (e.g. served
+        # from the HTTP cache) skips parsing and analysis entirely
+        self._article_results: "OrderedDict[tuple, Dict]" = OrderedDict()
+        self._article_results_lock = threading.Lock()
+        
+    def _create_http_adapter(self) -> HTTPAdapter:
+        """Create a pooled, retrying transport adapter, with HTTP caching when available."""
+        adapter_kwargs = {
+            'pool_connections': HTTP_POOL_HOSTS,
+            'pool_maxsize': HTTP_POOL_MAXSIZE,
+            'max_retries': Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        }
+        
+        if CacheControlAdapter is None:
+            return HTTPAdapter(**adapter_kwargs)
+        
+        # Responses with neither validators nor caching headers are kept for ARTICLE_CACHE_HOURS
+        return CacheControlAdapter(
+            cache=FileCache(ARTICLE_CACHE_DIR),
+            heuristic=_ExpiresAfterIfUncacheable(hours=ARTICLE_CACHE_HOURS),
+            **adapter_kwargs
+        )
+    
+    def read_article(self, url: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict]:
+        """Read and analyze an article from a URL.
+        
+        Args:
+            url: Article URL
+            fields: Derived fields to compute (any of 'summary', 'insights',
+                'topics'); None computes all of them. Skipped fields are
+                returned empty.
+        """
+        fields = ANALYSIS_FIELDS if fields is None else frozenset(fields)
         try:
             logger.info(f"Reading article: {url}")
             
             # Fetch the article
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
+            self._throttle_host(url)
+            with self.session.get(url, timeout=HTTP_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and not content_type.lower().startswith(HTML_CONTENT_TYPES):
+                    logger.warning(f"Skipping non-HTML content ({content_type}) at {url}")
+                    return None
+                html = self._read_body(response)
+            
+            # Reuse the previous analysis if the body has not changed
+            cache_key = (url, hashlib.sha256(html).digest(), fields)
+            cached = self._get_cached_article(cache_key)
+            if cached is not None:
+                logger.debug(f"Article body unchanged, reusing analysis for {url}")
+                return cached
             
             # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = self._parse_html(html, content_type)
             
             # Extract article content
-            article_data = self._extract_article_content(soup, url)
+            article_data = self._extract_article_content(tree, url)
             
             if not article_data:
                 logger.warning(f"Could not extract content from {url}")
                 return None
             
             # Generate intelligent summary
-            summary = self._generate_intelligent_summary(article_data)
+            summary = self._generate_intelligent_summary(article_data) if 'summary' in fields else ''
             
             # Extract key insights
-            insights = self._extract_key_insights(article_data)
+            insights = self._extract_key_insights(article_data) if 'insights' in fields else []
             
-            return {
+            # Extract topics
+            topics = self._extract_topics(article_data['content']) if 'topics' in fields else []
+            
+            result = {
                 'url': url,
                 'title': article_data.get('title', ''),
                 'content': article_data.get('content', ''),
                 'summary': summary,
                 'insights': insights,
                 'word_count': len(article_data.get('content', '').split()),
-                'topics': article_data.get('topics', []),
+                'topics': topics,
                 'source': self._extract_source(url),
                 'meta_description': article_data.get('meta_description', '')
             }
+            self._cache_article(cache_key, result)
+            return result
             
         except Exception as e:
             logger.error(f"Error reading article {url}: {e}")
             return None
     
-    def _extract_article_content(self, soup: BeautifulSoup, url: str) -> Optional[Dict]:
+    def _get_cached_article(self, key: tuple) -> Optional[Dict]:
+        """Return a copy of a previously analysed article, or None."""
+        with self._article_results_lock:
+            result = self._article_results.get(key)
+            if result is None:
+                return None
+            self._article_results.move_to_end(key)
+        return {**result, 'insights': list(result['insights']), 'topics': list(result['topics'])}
+    
+    def _cache_article(self, key: tuple, result: Dict) -> None:
+        """Remember an analysed article, evicting the least recently used one when full."""
+        with self._article_results_lock:
+            self._article_results[key] = {**result, 'insights': list(result['insights']), 'topics': list(result['topics'])}
+            if len(self._article_results) > ARTICLE_RESULT_CACHE_SIZE:
+                self._article_results.popitem(last=False)
+    
+    async def read_article_async(self, url: str) -> Optional[Dict]:
+        """Read an article without blocking the event loop.
+        
+        The fetch and parse run on a worker thread, so the shared session,
+        HTTP cache and per-host throttling all still apply.
+        """
+        return await asyncio.to_thread(self.read_article, url)
+    
+    async def read_articles_async(self, urls: List[str],
+                                  max_concurrency: int = ASYNC_MAX_CONCURRENCY) -> List[Optional[Dict]]:
+        """Read many articles concurrently, returning results in input order."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(url: str) -> Optional[Dict]:
+            async with semaphore:
+                return await self.read_article_async(url)
+        
+        return await asyncio.gather(*(bounded(url) for url in urls))
+    
+    def _read_body(self, response: requests.Response) -> bytes:
+        """Read a streamed response body, stopping after MAX_ARTICLE_BYTES."""
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            body.extend(chunk)
+            if len(body) >= MAX_ARTICLE_BYTES:
+                logger.info(f"Truncating article body at {MAX_ARTICLE_BYTES} bytes: {response.url}")
+                break
+        return bytes(body)
+    
+    def _parse_html(self, html: bytes, content_type: str) -> lxml.html.HtmlElement:
+        """Parse HTML bytes using the charset from the HTTP header, then <meta>, else a sniffed guess."""
+        header_match = HEADER_CHARSET_RE.search(content_type)
+        if header_match:
+            encoding = header_match.group(1)
+        else:
+            meta_match = META_CHARSET_RE.search(html, 0, 4096)
+            encoding = meta_match.group(1).decode('ascii') if meta_match else _sniff_charset(html)
+        
+        # Comments and processing instructions are never read, so don't build nodes for them
+        try:
+            parser = lxml.html.HTMLParser(encoding=encoding, **HTML_PARSER_OPTIONS)
+        except LookupError:
+            logger.debug(f"Unknown charset {encoding!r}, falling back to UTF-8")
+            parser = lxml.html.HTMLParser(encoding='utf-8', **HTML_PARSER_OPTIONS)
+        
+        return lxml.html.document_fromstring(html, parser=parser)
+    
+    def _throttle_host(self, url: str) -> None:
+        """Wait until at least HOST_MIN_INTERVAL has passed since the last request to this host."""
+        host = urlparse(url).netloc
+        with self._host_locks_guard:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+        
+        with host_lock:
+            last_request = self._host_last_request.get(host)
+            if last_request is not None:
+                wait = last_request + HOST_MIN_INTERVAL - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+            self._host_last_request[host] = time.monotonic()
+    
+    def _extract_article_content(self, tree: lxml.html.HtmlElement, url: str) -> Optional[Dict]:
         """Extract article content with multiple fallback methods."""
         try:
             # Method 1: Try specialized extraction patterns
-            content = self._extract_with_patterns(soup)
+            content = self._extract_with_patterns(tree)
+            meta_description = None
             
             # Method 2: Try meta description as fallback
             if not content or len(content) < 200:
-                meta_desc = self._extract_meta_description(soup)
-                if meta_desc and len(meta_desc) > 50:
+                meta_description = self._extract_meta_description(tree)
+                if len(meta_description) > 50:
                     logger.info(f"Using meta description as fallback for {url}")
-                    content = meta_desc
+                    content = meta_description
             
             # Method 3: Try newspaper3k-style extraction
             if not content or len(content) < 200:
-                content = self._extract_newspaper_style(soup)
-            
-            # Extract title
-            title = self._extract_title(soup)
+                content = self._extract_newspaper_style(tree)
             
-            # Extract meta description
-            meta_description = self._extract_meta_description(soup)
+            # Validate content before extracting anything else
+            if not content or len(content) <= 100:
+                logger.warning(f"Content extraction failed for {url}")
+                return None
             
-            # Clean and validate content
-            if content and len(content) > 100:
-                clean_content = self._clean_text_enhanced(content)
-                return {
-                    'title': title,
-                    'content': clean_content,
-                    'meta_description': meta_description,
-                    'topics': self._extract_topics(clean_content)
-                }
+            # Extract title and meta description (reusing the fallback lookup)
+            title = self._extract_title(tree)
+            if meta_description is None:
+                meta_description = self._extract_meta_description(tree)
             
-            logger.warning(f"Content extraction failed for {url}")
-            return None
+            # Clean content
+            clean_content = self._clean_text_enhanced(content)
+            return {
+                'title': title,
+                'content': clean_content,
+                'meta_description': meta_description
+            }
             
         except Exception as e:
             logger.error(f"Error in content extraction: {e}")
             return None
     
-    def _extract_with_patterns(self, soup: BeautifulSoup) -> str:
+    def _extract_with_patterns(self, tree: lxml.html.HtmlElement) -> str:
         """Extract content using common article patterns."""
         content_parts = []
         
-        # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'form', 'button']):
-            element.decompose()
+        # Remove unwanted elements (one C-level pass, keeping their tail text)
+        etree.strip_elements(tree, *UNWANTED_TAGS, with_tail=False)
         
         # Remove elements with unwanted classes/IDs
-        unwanted_patterns = [
-            'comment', 'related', 'sidebar', 'advertisement', 'social', 'share',
-            'menu', 'navigation', 'footer', 'header', 'cookie', 'popup'
-        ]
-        
-        for pattern in unwanted_patterns:
-            for element in soup.find_all(attrs={'class': re.compile(pattern, re.I)}):
-                element.decompose()
-            for element in soup.find_all(attrs={'id': re.compile(pattern, re.I)}):
-                element.decompose()
+        for element in UNWANTED_ATTR_XPATH(tree):
+            if element.getparent() is not None:
+                element.drop_tree()
         
         # Try article-specific selectors
-        selectors = [
-            'article',
-            '[class*="article"]',
-            '[class*="content"]',
-            '[class*="post"]',
-            '[class*="entry"]',
-            'main',
-            '.post-content',
-            '.entry-content',
-            '.article-content',
-            '.story-content'
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text(separator=' ', strip=True)
-                if len(text) > 200:
-                    content_parts.append(text)
+        for element in ARTICLE_XPATH(tree):
+            text = _element_text(element, separator=' ')
+            if len(text) > 200:
+                content_parts.append(text)
         
         # If no article-specific content found, try body content
         if not content_parts:
-            body = soup.find('body')
-            if body:
+            body = tree.find('body')
+            if body is not None:
                 # Get all text elements
-                for tag in body.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'blockquote']):
-                    text = tag.get_text(strip=True)
+                for tag in body.iter(*BODY_TEXT_TAGS):
+                    text = _element_text(tag)
                     if len(text) > 20 and not self._is_metadata_text(text):
                         content_parts.append(text)
         
         return ' '.join(content_parts)
     
-    def _extract_newspaper_style(self, soup: BeautifulSoup) -> str:
+    def _extract_newspaper_style(self, tree: lxml.html.HtmlElement) -> str:
         """Extract content using newspaper3k-style heuristics."""
         content_parts = []
         
         # Score paragraphs by various heuristics
-        paragraphs = soup.find_all(['p', 'div'])
         scored_paragraphs = []
         
-        for p in paragraphs:
-            text = p.get_text(strip=True)
+        for p in tree.iter('p', 'div'):
+            text = _element_text(p)
             if len(text) < 50:
                 continue
                 
@@ -191,63 +563,43 @@ class ArticleReader:
             score += min(len(text) / 10, 10)
             
             # Link density penalty
-            links = p.find_all('a')
-            if links:
-                link_density = len(links) / len(text.split())
+            link_count = LINK_COUNT_XPATH(p)
+            if link_count:
+                link_density = link_count / len(text.split())
                 score -= link_density * 50
             
             # Class/ID bonuses
-            if p.get('class'):
-                class_text = ' '.join(p.get('class')).lower()
-                if any(word in class_text for word in ['content', 'article', 'post', 'text']):
-                    score += 20
+            class_text = p.get('class', '').lower()
+            if any(word in class_text for word in CONTENT_CLASS_HINTS):
+                score += 20
             
             # Position bonus (earlier = higher)
             score += max(0, 10 - len(scored_paragraphs))
             
             scored_paragraphs.append((text, score))
         
-        # Sort by score and take top paragraphs
-        scored_paragraphs.sort(key=lambda x: x[1], reverse=True)
-        
-        for text, score in scored_paragraphs[:10]:
+        # Take top paragraphs by score
+        for text, score in heapq.nlargest(10, scored_paragraphs, key=lambda x: x[1]):
             if score > 5:
                 content_parts.append(text)
         
         return ' '.join(content_parts)
     
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree: lxml.html.HtmlElement) -> str:
         """Extract article title."""
-        # Try multiple title sources
-        title_selectors = [
-            'h1',
-            'title',
-            '[class*="title"]',
-            '[class*="headline"]',
-            'meta[property="og:title"]',
-            'meta[name="twitter:title"]'
-        ]
-        
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element:
-                title = element.get_text(strip=True) if element.name != 'meta' else element.get('content', '')
+        # Try multiple title sources, in priority order
+        for element in _first_matches(TITLE_CANDIDATES_XPATH(tree), TITLE_PRIORITIES):
+            if element is not None:
+                title = _element_text(element) if element.tag != 'meta' else element.get('content', '')
                 if title and len(title) > 10:
                     return title
         
         return ""
     
-    def _extract_meta_description(self, soup: BeautifulSoup) -> str:
+    def _extract_meta_description(self, tree: lxml.html.HtmlElement) -> str:
         """Extract meta description."""
-        meta_selectors = [
-            'meta[name="description"]',
-            'meta[property="og:description"]',
-            'meta[name="twitter:description"]'
-        ]
-        
-        for selector in meta_selectors:
-            element = soup.select_one(selector)
-            if element:
+        for element in _first_matches(META_DESCRIPTION_XPATH(tree), META_DESCRIPTION_PRIORITIES):
+            if element is not None:
                 desc = element.get('content', '')
                 if desc and len(desc) > 20:
                     return desc
@@ -256,28 +608,14 @@ class ArticleReader:
     
     def _is_metadata_text(self, text: str) -> bool:
         """Check if text is metadata rather than content."""
-        metadata_patterns = [
-            r'^Source:', r'^Credit:', r'^Image:', r'^Photo:', r'^Picture:',
-            r'^A computer-generated', r'^AI-generated', r'^This image shows',
-            r'^The image depicts', r'^Click here', r'^Read more',
-            r'^Share this', r'^Follow us', r'^Subscribe', r'^Newsletter'
-        ]
-        
-        text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in metadata_patterns)
+        # Only the leading characters can match, so avoid lowercasing the whole paragraph
+        return text[:METADATA_PREFIX_LEN].lower().startswith(METADATA_PREFIXES)
     
     def _clean_text_enhanced(self, text: str) -> str:
         """Enhanced text cleaning that preserves important punctuation."""
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove common metadata patterns
-        text = re.sub(r'Source:\s*[^.]*\.', '', text)
-        text = re.sub(r'Credit:\s*[^.]*\.', '', text)
-        text = re.sub(r'Image:\s*[^.]*\.', '', text)
+        # Collapse whitespace with C-level split/join (tags were already dropped
+        # during text extraction), then remove caption credits
+        text = CAPTION_RE.sub('', ' '.join(text.split()))
         
         # Preserve Unicode characters and punctuation
         text = text.strip()
@@ -294,30 +632,18 @@ class ArticleReader:
             if not content:
                 return f"📰 {title[:150]}..."
             
-            # Split content into sentences
-            sentences = re.split(r'[.!?]+', content)
-            sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 20]
+            # Split only as much content as is scored
+            sentences = list(islice(self._iter_sentences(content), SUMMARY_MAX_SENTENCES))
             
             if len(sentences) < 3:
                 return f"📰 {title[:150]}..."
             
             # Score sentences based on relevance
             scored_sentences = []
-            for sentence in sentences[:10]:  # Look at first 10 sentences
-                score = 0
-                
-                # Score based on robotics keywords
-                robotics_keywords = ['robot', 'robotics', 'ai', 'artificial intelligence', 'automation', 
-                                   'machine learning', 'computer vision', 'autonomous', 'sensor', 'algorithm']
-                for keyword in robotics_keywords:
-                    if keyword.lower() in sentence.lower():
-                        score += 2
-                
-                # Score based on technical terms
-                tech_terms = ['system', 'technology', 'development', 'research', 'study', 'experiment']
-                for term in tech_terms:
-                    if term.lower() in sentence.lower():
-                        score += 1
+            for sentence in sentences:
+                # Score based on robotics keywords and technical terms
+                matched = _find_keywords(sentence.lower(), SUMMARY_KEYWORD_WEIGHTS, SUMMARY_KEYWORD_AUTOMATON)
+                score = sum(SUMMARY_KEYWORD_WEIGHTS[keyword] for keyword in matched)
                 
                 # Score based on sentence position (earlier = higher)
                 position_score = max(0, 10 - len(scored_sentences))
@@ -325,9 +651,8 @@ class ArticleReader:
                 
                 scored_sentences.append((sentence, score))
             
-            # Sort by score and take top 2 sentences
-            scored_sentences.sort(key=lambda x: x[1], reverse=True)
-            top_sentences = [s[0] for s in scored_sentences[:2]]
+            # Take top 2 sentences by score
+            top_sentences = [s for s, _ in heapq.nlargest(2, scored_sentences, key=lambda x: x[1])]
             
             # Generate summary
             if top_sentences:
@@ -352,20 +677,23 @@ class ArticleReader:
             logger.error(f"Error generating intelligent summary: {e}")
             return f"📰 {title[:150]}..."
     
+    def _iter_sentences(self, content: str) -> Iterator[str]:
+        """Lazily yield stripped sentences longer than 20 characters."""
+        for match in SENTENCE_RE.finditer(content):
+            sentence = match.group().strip()
+            if len(sentence) > 20:
+                yield sentence
+    
     def _add_content_emoji(self, summary: str, title: str) -> str:
         """Add appropriate emoji based on content."""
         text_lower = (summary + ' ' + title).lower()
+        matched = _find_keywords(text_lower, EMOJI_KEYWORDS, EMOJI_KEYWORD_AUTOMATON)
         
-        if any(word in text_lower for word in ['breakthrough', 'novel', 'revolutionary', 'first']):
-            return f"🚀 {summary}"
-        elif any(word in text_lower for word in ['research', 'study', 'experiment', 'paper']):
-            return f"🔬 {summary}"
-        elif any(word in text_lower for word in ['announcement', 'launch', 'release']):
-            return f"📢 {summary}"
-        elif any(word in text_lower for word in ['improvement', 'better', 'faster', 'enhanced']):
-            return f"⚡ {summary}"
-        else:
-            return f"📰 {summary}"
+        for emoji, keywords in CONTENT_EMOJI_KEYWORDS:
+            if matched.intersection(keywords):
+                return f"{emoji} {summary}"
+        
+        return f"📰 {summary}"
     
     def _extract_key_insights(self, article_data: Dict) -> List[str]:
         """Extract key insights from article content."""
@@ -375,40 +703,33 @@ class ArticleReader:
         if not content:
             return insights
         
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 20]
-        
-        # Look for key phrases that indicate insights
-        insight_patterns = [
-            r'([^.]*?(?:breakthrough|innovation|discovery|advancement|milestone)[^.]*)',
-            r'([^.]*?(?:enables|allows|improves|enhances|reduces)[^.]*)',
-            r'([^.]*?(?:first time|never before|revolutionary|game-changing)[^.]*)',
-            r'([^.]*?(?:cost|efficiency|accuracy|speed|performance)[^.]*)'
-        ]
-        
-        for pattern in insight_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches[:2]:  # Limit to 2 matches per pattern
-                clean_match = match.strip()
-                if len(clean_match) > 20 and len(clean_match) < 200:
-                    insights.append(clean_match)
-        
-        return insights[:5]  # Return top 5 insights
+        # Keep segments containing key phrases, stopping once we have 5
+        for match in INSIGHT_SEGMENT_RE.finditer(content):
+            clean_match = match.group().strip()
+            if len(clean_match) <= 20 or len(clean_match) >= 200 or clean_match in insights:
+                continue
+            if _has_keyword(clean_match.lower(), INSIGHT_KEYWORDS, INSIGHT_KEYWORD_AUTOMATON):
+                insights.append(clean_match)
+                if len(insights) >= 5:
+                    break
+        
+        return insights
     
     def _extract_topics(self, content: str) -> List[str]:
         """Extract topics from content."""
         try:
-            return self.keyword_extractor.extract_topics(content)
+            return list(_topics_for_content(content))
         except Exception as e:
             logger.error(f"Error extracting topics: {e}")
             return []
     
-    def _extract_source(self, url: str) -> str:
-        """Extract source domain from URL."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_source(url: str) -> str:
+        """Extract source domain from URL (memoized across readers)."""
         try:
             parsed = urlparse(url)
-            domain = parsed.netloc.replace('www.', '')
+            domain = parsed.netloc.removeprefix('www.')
             return domain
         except Exception:
             return "unknown"
@@ -422,7 +743,7 @@ class ArticleReader:
                 return getattr(tweet, 'text', '')[:150] + "..."
             
             # Read article and generate enhanced summary
-            article_data = self.read_article(url)
+            article_data = self.read_article(url, fields=('summary',))
             if article_data:
                 return article_data['summary']
             else:
@@ -433,20 +754,22 @@ class ArticleReader:
             return getattr(tweet, 'text', '')[:150] + "..."
     
     def batch_enhance_summaries(self, tweets: List) -> List:
-        """Legacy method for batch processing."""
-        enhanced_tweets = []
-        
-        for tweet in tweets:
-            try:
-                enhanced_summary = self.enhance_tweet_summary(tweet)
-                tweet.enhanced_summary = enhanced_summary
-                enhanced_tweets.append(tweet)
-                
-                # Rate limiting
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error enhancing tweet {getattr(tweet, 'id', 'unknown')}: {e}")
-                enhanced_tweets.append(tweet)
+        """Legacy method for batch processing.
         
-        return enhanced_tweets 
\ No newline at end of file
+        Tweets are processed concurrently; rate limiting is applied per host
+        in read_article, so different sites are fetched in parallel.
+        """
+        if not tweets:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(tweets))) as executor:
+            # map() preserves input order
+            return list(executor.map(self._enhance_tweet, tweets))
+    
+    def _enhance_tweet(self, tweet):
+        """Attach an enhanced summary to a single tweet."""
+        try:
+            tweet.enhanced_summary = self.enhance_tweet_summary(tweet)
+        except Exception as e:
+            logger.error(f"Error enhancing tweet {getattr(tweet, 'id', 'unknown')}: {e}")
+        return tweet 
\ No newline at end of file
@@ -4,19 +4,22 @@ Streamlit-based dashboard for visualizing data and insights.
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import re
 import sys
 import os
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from storage.database import DatabaseManager
+from storage.database import DatabaseManager, Article, DashboardBundle
 from scoring.scoring_model import ScoringModel
 from nlp.keyword_extraction import KeywordExtractor
 
@@ -28,14 +31,83 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Seconds a database read is reused across Streamlit reruns
+DASHBOARD_CACHE_TTL = 60
+
+# Trending topics fetched once per rerun: the sidebar filter lists all, the chart shows the top 10
+TRENDING_TOPICS_LIMIT = 20
+
+# Top articles analysed by the category and keyword sections
+CATEGORY_ARTICLE_LIMIT = 100
+KEYWORD_ARTICLE_LIMIT = 50
+
+# Star ratings and their display labels
+RATING_VALUES = np.arange(1, 6)
+RATING_LABELS = ['1 Star', '2 Stars', '3 Stars', '4 Stars', '5 Stars']
+
+# Display text cleanup patterns
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+CAPTION_RE = re.compile(r'(?:Source|Credit|Image):\s*[^.]*\.|(?:A computer-generated|AI-generated)[^.]*\.')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Keyword prefixes left over from WordPress markup
+HTML_ARTIFACT_PREFIXES = ('class=', 'wp-', 'align', 'caption')
+
+# Keywords extracted per article; the table shows up to 6, keyword analytics counts the first 5
+ARTICLE_KEYWORD_LIMIT = 8
+
+
+# Shared across reruns and sessions: the database handle, the spaCy-backed
+# keyword extractor, and the scoring model (reloaded periodically so rating
+# preferences written to its config show up)
+@st.cache_resource(show_spinner=False)
+def _get_db() -> DatabaseManager:
+    return DatabaseManager()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_keyword_extractor() -> KeywordExtractor:
+    return KeywordExtractor()
+
+
+@st.cache_resource(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _get_scoring_model() -> ScoringModel:
+    return ScoringModel()
+
+
+# Cached database reads. Streamlit reruns the whole script on every widget change,
+# so each query is shared across reruns for DASHBOARD_CACHE_TTL seconds. The
+# leading underscore keeps the DatabaseManager out of the cache key.
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _load_top_articles(_db: DatabaseManager, limit: int) -> List[Article]:
+    return _db.get_top_articles(limit=limit)
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _load_dashboard_bundle(_db: DatabaseManager, trending_limit: int) -> DashboardBundle:
+    return _db.get_dashboard_bundle(days=7, limit_topics=trending_limit, limit_authors=10)
+
+
+@st.cache_data(show_spinner=False, max_entries=1024)
+def _extract_article_keywords(_extractor: KeywordExtractor, content_text: str) -> List[str]:
+    """Extract an article's keywords once, shared by the table and keyword analytics."""
+    return _extractor.extract_keywords(content_text, max_keywords=ARTICLE_KEYWORD_LIMIT)
+
+
+def _filter_keywords(keywords: List[str]) -> List[str]:
+    """Drop HTML artifacts and very short words from extracted keywords."""
+    return [keyword for keyword in keywords
+            if len(keyword) > 2 and not keyword.startswith(HTML_ARTIFACT_PREFIXES)]
+
+
 class AnalyticsDashboard:
     """Streamlit dashboard for Robotics Radar analytics."""
     
     def __init__(self):
         """Initialize dashboard."""
-        self.db = DatabaseManager()
-        self.scoring_model = ScoringModel()
-        self.keyword_extractor = KeywordExtractor()
+        self.db = _get_db()
+        self.scoring_model = _get_scoring_model()
+        self.keyword_extractor = _get_keyword_extractor()
         
     def run(self):
         """Run the dashboard."""
@@ -43,39 +115,50 @@ class AnalyticsDashboard:
         st.title("🤖 Robotics Radar Dashboard")
         st.markdown("Real-time analytics and insights for robotics content curation")
         
+        # Load every aggregate once per rerun
+        bundle = _load_dashboard_bundle(self.db, TRENDING_TOPICS_LIMIT)
+        
         # Sidebar
-        self._create_sidebar()
+        self._create_sidebar(bundle.trending_topics)
+        
+        # Load the top articles once; each section takes its own slice
+        num_articles = st.session_state.num_articles
+        tweets = _load_top_articles(self.db, max(num_articles, CATEGORY_ARTICLE_LIMIT, KEYWORD_ARTICLE_LIMIT))
         
         # Main content
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            self._show_overview_metrics()
-            self._show_trending_topics()
-            self._show_top_tweets()
+            self._show_overview_metrics(bundle.analytics_summary)
+            self._show_trending_topics(bundle.trending_topics[:10])
+            self._show_top_tweets(tweets[:num_articles])
         
         with col2:
-            self._show_top_authors()
-            self._show_feedback_analytics()
+            self._show_top_authors(bundle.top_authors)
+            self._show_feedback_analytics(bundle.feedback_stats)
         
         # Bottom section
         col3, col4 = st.columns(2)
         
         with col3:
-            self._show_engagement_metrics()
+            self._show_engagement_metrics(bundle.engagement_trends)
         
         with col4:
-            self._show_content_analysis()
+            self._show_content_analysis(bundle.content_categories)
         
         # Review status section
-        self._show_review_status()
+        self._show_review_status(bundle.review_status)
         
         # Category and keyword analytics sections
-        self._show_category_analytics()
-        self._show_keyword_analytics()
+        self._show_category_analytics(tweets[:CATEGORY_ARTICLE_LIMIT])
+        self._show_keyword_analytics(tweets[:KEYWORD_ARTICLE_LIMIT])
     
-    def _create_sidebar(self):
-        """Create sidebar with filters and controls."""
+    def _create_sidebar(self, trending_topics: List[Dict]):
+        """Create sidebar with filters and controls.
+        
+        Args:
+            trending_topics: Trending topics offered in the topic filter
+        """
         st.sidebar.header("Dashboard Controls")
         
         # Time range filter
@@ -108,7 +191,7 @@ class AnalyticsDashboard:
         
         # Topic filter
         st.sidebar.subheader("Topic Filter")
-        topics = self._get_available_topics()
+        topics = self._get_available_topics(trending_topics)
         selected_topics = st.sidebar.multiselect(
             "Select topics:",
             topics,
@@ -117,6 +200,8 @@ class AnalyticsDashboard:
         
         # Refresh button
         if st.sidebar.button("🔄 Refresh Data"):
+            st.cache_data.clear()
+            _get_scoring_model.clear()
             st.rerun()
         
         # Store filters in session state
@@ -125,13 +210,15 @@ class AnalyticsDashboard:
         st.session_state.selected_topics = selected_topics
         st.session_state.num_articles = num_articles
     
-    def _show_overview_metrics(self):
-        """Show overview metrics."""
+    def _show_overview_metrics(self, analytics: Dict):
+        """Show overview metrics.
+        
+        Args:
+            analytics: Analytics summary from the dashboard bundle
+        """
         st.header("📈 Overview Metrics")
         
         try:
-            analytics = self.db.get_analytics_summary()
-            
             # Create metrics cards
             col1, col2, col3, col4 = st.columns(4)
             
@@ -166,13 +253,15 @@ class AnalyticsDashboard:
         except Exception as e:
             st.error(f"Error loading overview metrics: {e}")
     
-    def _show_trending_topics(self):
-        """Show trending topics visualization."""
+    def _show_trending_topics(self, topics: List[Dict]):
+        """Show trending topics visualization.
+        
+        Args:
+            topics: Trending topics to chart
+        """
         st.header("🔥 Trending Topics")
         
         try:
-            topics = self.db.get_trending_topics(limit=10)
-            
             if topics:
                 # Create DataFrame
                 df = pd.DataFrame(topics)
@@ -207,46 +296,41 @@ class AnalyticsDashboard:
         except Exception as e:
             st.error(f"Error loading trending topics: {e}")
     
-    def _show_top_tweets(self):
-        """Show top tweets table."""
+    def _show_top_tweets(self, tweets: List[Article]):
+        """Show top tweets table.
+        
+        Args:
+            tweets: Top articles to list, best first
+        """
         st.header("🏆 Top Articles")
         
         try:
-            # Get number of articles from session state or default to 20
-            num_articles = getattr(st.session_state, 'num_articles', 20)
-            tweets = self.db.get_top_articles(limit=num_articles)
-            
             if tweets:
-                # Create DataFrame with deduplication
-                data = []
-                seen_urls = set()
-                
-                for tweet in tweets:
-                    # Skip if we've already seen this URL (deduplicate)
-                    if tweet.url in seen_urls:
-                        continue
-                    seen_urls.add(tweet.url)
-                    
-                    # Clean the text for display
-                    clean_text = self._clean_text_for_display(tweet.text)
-                    
-                    # Extract keywords from topics or generate them
-                    keywords = self._extract_keywords_for_display(tweet)
-                    
-                    data.append({
-                        'Author': f"@{tweet.author_username}",
-                        'Title': clean_text[:80] + "..." if len(clean_text) > 80 else clean_text,
-                        'Summary': tweet.summary[:120] + "..." if len(tweet.summary) > 120 else tweet.summary if tweet.summary else "No summary",
-                        'Keywords': keywords,
-                        'Score': f"{tweet.score:.2f}",
-                        'Likes': tweet.likes,
-                        'Retweets': tweet.retweets,
-                        'Replies': tweet.replies,
-                        'Created': tweet.created_at.strftime('%Y-%m-%d %H:%M'),
-                        'URL': tweet.url
-                    })
-                
-                df = pd.DataFrame(data)
+                # Build the table column-wise, keeping the first article per URL
+                df = pd.DataFrame({
+                    'Author': [f"@{tweet.author_username}" for tweet in tweets],
+                    'Title': [self._clean_text_for_display(tweet.text) for tweet in tweets],
+                    'Summary': [tweet.summary or "" for tweet in tweets],
+                    'Keywords': [self._extract_keywords_for_display(tweet) for tweet in tweets],
+                    'Score': np.array([tweet.score for tweet in tweets], dtype=np.float64),
+                    'Likes': [tweet.likes for tweet in tweets],
+                    'Retweets': [tweet.retweets for tweet in tweets],
+                    'Replies': [tweet.replies for tweet in tweets],
+                    'Created': pd.to_datetime([tweet.created_at for tweet in tweets]).strftime('%Y-%m-%d %H:%M'),
+                    'URL': [tweet.url for tweet in tweets]
+                }).drop_duplicates('URL', keep='first').reset_index(drop=True)
+                
+                # Few authors post many articles, so store them as a categorical
+                df['Author'] = df['Author'].astype('category')
+                
+                # Truncate long titles and summaries
+                titles = df['Title']
+                df['Title'] = titles.where(titles.str.len() <= 80, titles.str[:80] + "...")
+                summaries = df['Summary']
+                df['Summary'] = (
+                    summaries.where(summaries.str.len() <= 120, summaries.str[:120] + "...")
+                    .where(summaries != "", "No summary")
+                )
                 
                 # Display table
                 st.dataframe(
@@ -278,21 +362,14 @@ class AnalyticsDashboard:
         Returns:
             Cleaned text
         """
-        import re
-        
-        # Remove HTML tags
-        clean_text = re.sub(r'<[^>]+>', '', text)
+        # Remove HTML tags (including <img> tags and their alt text)
+        clean_text = HTML_TAG_RE.sub('', text)
         
         # Remove image descriptions and metadata
-        clean_text = re.sub(r'<img[^>]*alt="[^"]*"[^>]*>', '', clean_text)
-        clean_text = re.sub(r'Source:\s*[^.]*\.', '', clean_text)
-        clean_text = re.sub(r'Credit:\s*[^.]*\.', '', clean_text)
-        clean_text = re.sub(r'Image:\s*[^.]*\.', '', clean_text)
-        clean_text = re.sub(r'A computer-generated[^.]*\.', '', clean_text)
-        clean_text = re.sub(r'AI-generated[^.]*\.', '', clean_text)
+        clean_text = CAPTION_RE.sub('', clean_text)
         
         # Remove extra whitespace
-        clean_text = re.sub(r'\s+', ' ', clean_text)
+        clean_text = WHITESPACE_RE.sub(' ', clean_text)
         
         return clean_text.strip()
     
@@ -306,31 +383,11 @@ class AnalyticsDashboard:
             Formatted keywords string
         """
         try:
-            # Always extract fresh keywords from the text content
-            from nlp.keyword_extraction import KeywordExtractor
-            extractor = KeywordExtractor()
-            
-            # Clean the text first to remove HTML artifacts
-            clean_text = self._clean_text_for_display(tweet.text)
-            content_text = clean_text
-            
-            if tweet.summary:
-                clean_summary = self._clean_text_for_display(tweet.summary)
-                content_text += f" {clean_summary}"
-            
-            keywords = extractor.extract_keywords(content_text, max_keywords=8)
+            keywords = self._get_article_keywords(tweet)
             
             if keywords:
                 # Filter out HTML artifacts and short words
-                filtered_keywords = []
-                for keyword in keywords:
-                    # Skip HTML artifacts and very short words
-                    if (len(keyword) > 2 and 
-                        not keyword.startswith('class=') and 
-                        not keyword.startswith('wp-') and
-                        not keyword.startswith('align') and
-                        not keyword.startswith('caption')):
-                        filtered_keywords.append(keyword)
+                filtered_keywords = _filter_keywords(keywords)
                 
                 # Format keywords nicely
                 formatted_keywords = ", ".join(filtered_keywords[:6])  # Show top 6 keywords
@@ -341,13 +398,33 @@ class AnalyticsDashboard:
         except Exception as e:
             return "No keywords"
     
-    def _show_top_authors(self):
-        """Show top authors visualization."""
+    def _get_article_keywords(self, tweet) -> List[str]:
+        """Get the (cached) keywords for an article's cleaned text and summary.
+        
+        Args:
+            tweet: Tweet object
+            
+        Returns:
+            Up to ARTICLE_KEYWORD_LIMIT keywords, most relevant first
+        """
+        # Clean the text first to remove HTML artifacts
+        content_text = self._clean_text_for_display(tweet.text)
+        
+        if tweet.summary:
+            clean_summary = self._clean_text_for_display(tweet.summary)
+            content_text += f" {clean_summary}"
+        
+        return _extract_article_keywords(self.keyword_extractor, content_text)
+    
+    def _show_top_authors(self, authors: List[Dict]):
+        """Show top authors visualization.
+        
+        Args:
+            authors: Top authors from the dashboard bundle
+        """
         st.header("👥 Top Authors")
         
         try:
-            authors = self.db.get_top_authors(limit=10)
-            
             if authors:
                 # Create DataFrame
                 df = pd.DataFrame(authors)
@@ -381,31 +458,29 @@ class AnalyticsDashboard:
         except Exception as e:
             st.error(f"Error loading top authors: {e}")
     
-    def _show_feedback_analytics(self):
-        """Show feedback analytics with 1-5 star rating system."""
+    def _show_feedback_analytics(self, feedback_stats: Dict):
+        """Show feedback analytics with 1-5 star rating system.
+        
+        Args:
+            feedback_stats: Rating counts from the dashboard bundle
+        """
         st.header("💬 Feedback Analytics")
         
         try:
-            # Get real feedback data from database
-            feedback_stats = self.db.get_feedback_stats()
-            
             if feedback_stats:
-                # Extract 1-5 star ratings
-                ratings = {
-                    '1 Star': feedback_stats.get('rating_1', 0),
-                    '2 Stars': feedback_stats.get('rating_2', 0),
-                    '3 Stars': feedback_stats.get('rating_3', 0),
-                    '4 Stars': feedback_stats.get('rating_4', 0),
-                    '5 Stars': feedback_stats.get('rating_5', 0)
-                }
+                # Extract 1-5 star rating counts
+                counts = np.array(
+                    [feedback_stats.get(f'rating_{rating}', 0) for rating in RATING_VALUES],
+                    dtype=np.int64
+                )
                 
-                total_ratings = sum(ratings.values())
+                total_ratings = int(counts.sum())
                 
                 if total_ratings > 0:
                     # Create pie chart for rating distribution
                     fig = go.Figure(data=[go.Pie(
-                        labels=list(ratings.keys()),
-                        values=list(ratings.values()),
+                        labels=RATING_LABELS,
+                        values=counts.tolist(),
                         hole=0.3,
                         marker_colors=['#ff6b6b', '#ffa726', '#ffeb3b', '#66bb6a', '#42a5f5']
                     )])
@@ -419,8 +494,7 @@ class AnalyticsDashboard:
                     st.plotly_chart(fig, use_container_width=True)
                     
                     # Calculate average rating
-                    weighted_sum = sum(i * ratings[f'{i} Star{"s" if i > 1 else ""}'] for i in range(1, 6))
-                    avg_rating = weighted_sum / total_ratings if total_ratings > 0 else 0
+                    avg_rating = float(np.dot(RATING_VALUES, counts)) / total_ratings
                     
                     # Show feedback stats
                     col1, col2, col3 = st.columns(3)
@@ -429,14 +503,16 @@ class AnalyticsDashboard:
                     with col2:
                         st.metric("Average Rating", f"{avg_rating:.1f} ⭐")
                     with col3:
-                        st.metric("5-Star Ratings", f"{ratings['5 Stars']}")
+                        st.metric("5-Star Ratings", f"{counts[-1]}")
                     
                     # Show detailed rating breakdown
                     st.subheader("Rating Breakdown")
-                    rating_df = pd.DataFrame([
-                        {"Rating": k, "Count": v, "Percentage": f"{(v/total_ratings)*100:.1f}%"}
-                        for k, v in ratings.items() if v > 0
-                    ])
+                    rated = counts > 0
+                    rating_df = pd.DataFrame({
+                        "Rating": np.array(RATING_LABELS)[rated],
+                        "Count": counts[rated],
+                        "Percentage": [f"{share:.1f}%" for share in counts[rated] / total_ratings * 100]
+                    })
                     st.dataframe(rating_df, use_container_width=True)
                     
                 else:
@@ -447,33 +523,33 @@ class AnalyticsDashboard:
         except Exception as e:
             st.error(f"Error loading feedback analytics: {e}")
     
-    def _show_engagement_metrics(self):
-        """Show engagement metrics."""
+    def _show_engagement_metrics(self, engagement_data: List[Dict]):
+        """Show engagement metrics.
+        
+        Args:
+            engagement_data: Daily engagement trends from the dashboard bundle
+        """
         st.header("📊 Content Metrics")
         
         try:
-            # Get real engagement data from database
-            engagement_data = self.db.get_engagement_trends(days=7)
-            
             if engagement_data and len(engagement_data) > 1:
                 # Create line chart
                 fig = go.Figure()
                 
-                dates = [item['date'] for item in engagement_data]
-                scores = [item['avg_score'] for item in engagement_data]
-                counts = [item['article_count'] for item in engagement_data]
+                # Rows are already aggregated per day by the database
+                df = pd.DataFrame(engagement_data)
                 
                 fig.add_trace(go.Scatter(
-                    x=dates,
-                    y=scores,
+                    x=df['date'],
+                    y=df['avg_score'],
                     mode='lines+markers',
                     name='Average Score',
                     line=dict(color='#1da1f2')
                 ))
                 
                 fig.add_trace(go.Scatter(
-                    x=dates,
-                    y=counts,
+                    x=df['date'],
+                    y=df['article_count'],
                     mode='lines+markers',
                     name='Article Count',
                     line=dict(color='#17bf63'),
@@ -499,23 +575,34 @@ class AnalyticsDashboard:
         except Exception as e:
             st.error(f"Error loading engagement metrics: {e}")
     
-    def _show_content_analysis(self):
-        """Show content analysis."""
+    def _show_content_analysis(self, content_data: List[Dict]):
+        """Show content analysis.
+        
+        Args:
+            content_data: Category statistics from the dashboard bundle
+        """
         st.header("📝 Content Analysis")
         
         try:
-            # Get real content analysis data from database
-            content_data = self.db.get_content_categories()
-            
             if content_data:
+                # Build category labels once for the chart and the insights
+                df = pd.DataFrame({
+                    'count': [item['count'] for item in content_data],
+                    'category': [
+                        ', '.join(item['categories']) if isinstance(item['categories'], list) else str(item['categories'])
+                        for item in content_data
+                    ]
+                })
+                
                 # Create horizontal bar chart
                 fig = px.bar(
-                    x=[item['count'] for item in content_data],
-                    y=[', '.join(item['categories']) if isinstance(item['categories'], list) else str(item['categories']) for item in content_data],
+                    df,
+                    x='count',
+                    y='category',
                     orientation='h',
                     title="Content Categories",
-                    labels={'x': 'Count', 'y': 'Category'},
-                    color=[item['count'] for item in content_data],
+                    labels={'count': 'Count', 'category': 'Category'},
+                    color='count',
                     color_continuous_scale='viridis'
                 )
                 
@@ -528,13 +615,9 @@ class AnalyticsDashboard:
                 
                 # Show content insights
                 with st.expander("💡 Content Insights"):
-                    for item in content_data[:3]:
-                        category_name = ', '.join(item['categories']) if isinstance(item['categories'], list) else str(item['categories'])
-                        st.write(f"• **{category_name}** posts: {item['count']} articles")
-                    if content_data:
-                        top_category = content_data[0]
-                        category_name = ', '.join(top_category['categories']) if isinstance(top_category['categories'], list) else str(top_category['categories'])
-                        st.write(f"• **{category_name}** is the most popular category")
+                    for category_name, count in zip(df['category'].head(3), df['count'].head(3)):
+                        st.write(f"• **{category_name}** posts: {count} articles")
+                    st.write(f"• **{df['category'].iloc[0]}** is the most popular category")
                 
             else:
                 st.info("No content analysis data available yet")
@@ -542,49 +625,36 @@ class AnalyticsDashboard:
         except Exception as e:
             st.error(f"Error loading content analysis: {e}")
     
-    def _show_category_analytics(self):
-        """Show category-based analytics."""
+    def _show_category_analytics(self, tweets: List[Article]):
+        """Show category-based analytics.
+        
+        Args:
+            tweets: Top articles to aggregate by category
+        """
         st.header("🏷️ Category Analytics")
         
         try:
-            # Get articles with categories
-            tweets = self.db.get_top_articles(limit=100)
-            
             if tweets:
-                # Extract category data
-                category_data = {}
-                for tweet in tweets:
-                    if tweet.categories:
-                        for category in tweet.categories:
-                            if category not in category_data:
-                                category_data[category] = {
-                                    'count': 0,
-                                    'total_score': 0.0,
-                                    'avg_score': 0.0
-                                }
-                            category_data[category]['count'] += 1
-                            category_data[category]['total_score'] += tweet.score
-                
-                # Calculate average scores
-                for category in category_data:
-                    if category_data[category]['count'] > 0:
-                        category_data[category]['avg_score'] = (
-                            category_data[category]['total_score'] / 
-                            category_data[category]['count']
-                        )
-                
-                if category_data:
-                    # Create category distribution chart
-                    categories = list(category_data.keys())
-                    counts = [category_data[cat]['count'] for cat in categories]
-                    avg_scores = [category_data[cat]['avg_score'] for cat in categories]
-                    
+                # Aggregate count/total/average score per category in one groupby
+                # (sort=False keeps categories in order of first appearance)
+                category_data = (
+                    pd.DataFrame({
+                        'category': [tweet.categories for tweet in tweets],
+                        'score': [tweet.score for tweet in tweets]
+                    })
+                    .explode('category')
+                    .dropna(subset=['category'])
+                    .groupby('category', sort=False)['score']
+                    .agg(count='count', total_score='sum', avg_score='mean')
+                )
+                
+                if not category_data.empty:
                     # Create bar chart
                     fig = go.Figure()
                     
                     fig.add_trace(go.Bar(
-                        x=categories,
-                        y=counts,
+                        x=category_data.index.tolist(),
+                        y=category_data['count'].tolist(),
                         name='Article Count',
                         marker_color='#1da1f2'
                     ))
@@ -601,15 +671,12 @@ class AnalyticsDashboard:
                     
                     # Show category details
                     st.subheader("Category Performance")
-                    category_df = pd.DataFrame([
-                        {
-                            "Category": cat,
-                            "Articles": data['count'],
-                            "Avg Score": f"{data['avg_score']:.2f}",
-                            "Total Score": f"{data['total_score']:.2f}"
-                        }
-                        for cat, data in category_data.items()
-                    ])
+                    category_df = pd.DataFrame({
+                        "Category": category_data.index,
+                        "Articles": category_data['count'].to_numpy(),
+                        "Avg Score": category_data['avg_score'].map('{:.2f}'.format).to_numpy(),
+                        "Total Score": category_data['total_score'].map('{:.2f}'.format).to_numpy()
+                    })
                     
                     st.dataframe(category_df, use_container_width=True)
                     
@@ -645,80 +712,61 @@ class AnalyticsDashboard:
         except Exception as e:
             st.error(f"Error loading category analytics: {e}")
     
-    def _show_keyword_analytics(self):
-        """Show keyword-based analytics."""
+    def _show_keyword_analytics(self, tweets: List[Article]):
+        """Show keyword-based analytics.
+        
+        Args:
+            tweets: Top articles to count keywords in
+        """
         st.header("🔍 Keyword Analytics")
         
         try:
-            # Get articles for keyword analysis
-            tweets = self.db.get_top_articles(limit=50)
-            
             if tweets:
-                # Extract keywords from all articles
-                from nlp.keyword_extraction import KeywordExtractor
-                extractor = KeywordExtractor()
-                
-                all_keywords = []
+                # Count keywords across all articles (shared with the top articles table)
+                keyword_counts = Counter()
+                total_keywords = 0
                 for tweet in tweets:
-                    # Clean the text first to remove HTML artifacts
-                    clean_text = self._clean_text_for_display(tweet.text)
-                    content_text = clean_text
-                    
-                    if tweet.summary:
-                        clean_summary = self._clean_text_for_display(tweet.summary)
-                        content_text += f" {clean_summary}"
-                    
-                    keywords = extractor.extract_keywords(content_text, max_keywords=5)
+                    keywords = self._get_article_keywords(tweet)[:5]
                     
                     # Filter out HTML artifacts and short words
-                    filtered_keywords = []
-                    for keyword in keywords:
-                        if (len(keyword) > 2 and 
-                            not keyword.startswith('class=') and 
-                            not keyword.startswith('wp-') and
-                            not keyword.startswith('align') and
-                            not keyword.startswith('caption')):
-                            filtered_keywords.append(keyword)
+                    filtered_keywords = _filter_keywords(keywords)
                     
-                    all_keywords.extend(filtered_keywords)
-                
-                # Count keyword frequency
-                from collections import Counter
-                keyword_counts = Counter(all_keywords)
+                    keyword_counts.update(filtered_keywords)
+                    total_keywords += len(filtered_keywords)
                 
                 if keyword_counts:
                     # Get top 15 keywords
                     top_keywords = keyword_counts.most_common(15)
                     
-                    # Create bar chart
-                    keywords, counts = zip(*top_keywords)
+                    # Create bar chart from the top keywords only
+                    keywords = [keyword for keyword, _ in top_keywords]
+                    frequencies = np.array([count for _, count in top_keywords], dtype=np.int64)
                     
                     fig = go.Figure(data=[go.Bar(
                         x=keywords,
-                        y=counts,
+                        y=frequencies,
                         marker_color='#ff6b6b'
                     )])
                     
+                    # uirevision keeps the user's zoom/pan across reruns
                     fig.update_layout(
                         title="Most Common Keywords",
                         xaxis_title="Keywords",
                         yaxis_title="Frequency",
                         height=400,
-                        xaxis_tickangle=-45
+                        xaxis_tickangle=-45,
+                        uirevision='keyword-bar'
                     )
                     
                     st.plotly_chart(fig, use_container_width=True)
                     
                     # Show keyword details
                     st.subheader("Keyword Frequency")
-                    keyword_df = pd.DataFrame([
-                        {
-                            "Keyword": keyword,
-                            "Frequency": count,
-                            "Percentage": f"{(count/len(all_keywords)*100):.1f}%"
-                        }
-                        for keyword, count in top_keywords
-                    ])
+                    keyword_df = pd.DataFrame({
+                        "Keyword": keywords,
+                        "Frequency": frequencies,
+                        "Percentage": [f"{share:.1f}%" for share in frequencies / total_keywords * 100]
+                    })
                     
                     st.dataframe(keyword_df, use_container_width=True)
                 else:
@@ -729,14 +777,15 @@ class AnalyticsDashboard:
         except Exception as e:
             st.error(f"Error loading keyword analytics: {e}")
     
-    def _show_review_status(self):
-        """Show review status for articles."""
+    def _show_review_status(self, review_data: List[Dict]):
+        """Show review status for articles.
+        
+        Args:
+            review_data: Articles with review status from the dashboard bundle
+        """
         st.header("📋 Review Status")
         
         try:
-            # Get articles with review status
-            review_data = self.db.get_articles_with_review_status()
-            
             if not review_data:
                 st.info("No articles with review status available")
                 return
@@ -825,14 +874,16 @@ class AnalyticsDashboard:
         except Exception as e:
             st.error(f"Error loading review status: {e}")
     
-    def _get_available_topics(self) -> List[str]:
+    def _get_available_topics(self, topics: List[Dict]) -> List[str]:
         """Get available topics for filtering.
         
+        Args:
+            topics: Trending topics from the dashboard bundle
+            
         Returns:
             List of available topics
         """
         try:
-            topics = self.db.get_trending_topics(limit=20)
             return [topic['name'] for topic in topics]
         except Exception as e:
             st.error(f"Error getting available topics: {e}")
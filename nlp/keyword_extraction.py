@@ -4,16 +4,363 @@ Handles keyword extraction and topic analysis using spaCy.
 """
 
 import logging
+import os
+import numpy as np
 import spacy
-from typing import List, Dict, Set, Optional
+from spacy.attrs import POS, IS_STOP, IS_PUNCT, LENGTH
+from spacy.symbols import NOUN, PROPN
+from typing import List, Dict, Set, Optional, Iterable, Tuple
 import re
 from collections import Counter
+from functools import lru_cache
 import yaml
 
+# Optional C-based multi-pattern matcher; plain substring scans are used without it
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of texts spaCy processes per batch in analyze_many
+SPACY_BATCH_SIZE = int(os.getenv('RADAR_SPACY_BATCH', '64'))
+
+# analyze_many stays single-process below this many texts, where starting
+# worker processes costs more than it saves
+MULTIPROCESS_MIN_TEXTS = 200
+
+# spaCy components never used here. attribute_ruler is kept: it maps the tagger's
+# tags to the coarse POS that the keyword filter and the lemmatizer rely on.
+SPACY_EXCLUDED_PIPES = ['parser']
+# Components skipped by the single-purpose keyword and entity calls
+KEYWORD_DISABLED_PIPES = ['ner']
+ENTITY_DISABLED_PIPES = ['tagger', 'attribute_ruler', 'lemmatizer']
+
+# Token attributes read in bulk by the keyword filter, one column each
+KEYWORD_TOKEN_ATTRS = [POS, IS_STOP, IS_PUNCT, LENGTH]
+
+# Basic keyword tokenizer: URLs, mentions and hashtags match with an empty group
+# and are skipped; words of three or more letters are captured. A URL may start
+# mid-word ("abhttp://x", "awwwesome"), so neither words nor mentions/hashtags
+# may run into one; this matches stripping URLs first, then mentions/hashtags.
+KEYWORD_TOKEN_RE = re.compile(
+    r'http\S+|www\S+|[@#](?:(?!http\S|www\S)\w)+'
+    r'|\b((?:(?!http\S|www\S)[a-zA-Z]){3,})(?=\b|http\S|www\S)'
+)
+
+# Common stop words dropped by basic keyword extraction
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her',
+    'us', 'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their'
+})
+
+# Word lists for keyword-based sentiment analysis
+POSITIVE_WORDS = frozenset({
+    'amazing', 'awesome', 'great', 'excellent', 'outstanding', 'brilliant',
+    'innovative', 'breakthrough', 'exciting', 'promising', 'successful',
+    'improved', 'better', 'faster', 'stronger', 'efficient', 'effective'
+})
+NEGATIVE_WORDS = frozenset({
+    'terrible', 'awful', 'bad', 'poor', 'disappointing', 'failed',
+    'broken', 'problem', 'issue', 'difficult', 'challenging', 'expensive',
+    'slow', 'weak', 'inefficient', 'unreliable'
+})
+
+# Robotics categories and the phrases that identify them, in output order
+CATEGORY_PATTERNS = {
+    'industrial_automation': (
+        'industrial', 'automation', 'manufacturing', 'factory', 'assembly',
+        'production', 'warehouse', 'logistics', 'supply chain', 'industry 4.0'
+    ),
+    'educational_robotics': (
+        'education', 'learning', 'teaching', 'student', 'school', 'university',
+        'academic', 'curriculum', 'robotics education', 'stem education'
+    ),
+    'robotics_ethics': (
+        'ethics', 'ethical', 'responsible', 'safety', 'regulation', 'policy',
+        'governance', 'bias', 'fairness', 'transparency', 'accountability'
+    ),
+    'agricultural_robotics': (
+        'agriculture', 'farming', 'crop', 'harvest', 'irrigation', 'precision',
+        'agtech', 'agri', 'farm', 'food production', 'horticulture'
+    ),
+    'medical_robotics': (
+        'medical', 'healthcare', 'surgery', 'hospital', 'patient', 'diagnosis',
+        'treatment', 'rehabilitation', 'prosthetics', 'telemedicine'
+    ),
+    'autonomous_vehicles': (
+        'autonomous', 'self-driving', 'vehicle', 'car', 'transportation',
+        'mobility', 'av', 'autonomous vehicle', 'driverless'
+    ),
+    'humanoid_robotics': (
+        'humanoid', 'human-like', 'bipedal', 'anthropomorphic', 'humanoid robot',
+        'android', 'humanoid robotics'
+    ),
+    'swarm_robotics': (
+        'swarm', 'collective', 'multi-robot', 'distributed', 'coordination',
+        'swarm robotics', 'collective behavior'
+    ),
+    'soft_robotics': (
+        'soft', 'flexible', 'compliant', 'deformable', 'soft robotics',
+        'soft robot', 'flexible robot'
+    ),
+    'research_robotics': (
+        'research', 'study', 'experiment', 'investigation', 'analysis',
+        'scientific', 'academic research', 'robotics research'
+    ),
+    'consumer_robotics': (
+        'consumer', 'home', 'domestic', 'personal', 'household', 'entertainment',
+        'consumer robot', 'home robot'
+    ),
+    'military_robotics': (
+        'military', 'defense', 'security', 'weapon', 'combat', 'surveillance',
+        'defense robotics', 'military robot'
+    ),
+    'space_robotics': (
+        'space', 'satellite', 'rover', 'mars', 'nasa', 'spacecraft',
+        'space robotics', 'space robot'
+    ),
+    'underwater_robotics': (
+        'underwater', 'marine', 'ocean', 'submarine', 'aquatic', 'underwater robot',
+        'marine robotics', 'ocean robotics'
+    ),
+    'aerial_robotics': (
+        'aerial', 'drone', 'uav', 'quadcopter', 'flying', 'airborne',
+        'aerial robotics', 'drone robotics'
+    ),
+    'collaborative_robotics': (
+        'collaborative', 'cobot', 'human-robot', 'collaboration', 'cooperation',
+        'collaborative robot', 'cobot'
+    ),
+    'mobile_robotics': (
+        'mobile', 'navigation', 'localization', 'mapping', 'path planning',
+        'mobile robot', 'autonomous navigation'
+    ),
+    'robotics_software': (
+        'software', 'algorithm', 'programming', 'code', 'framework', 'library',
+        'robotics software', 'robot software'
+    ),
+    'robotics_hardware': (
+        'hardware', 'sensor', 'actuator', 'motor', 'controller', 'mechanical',
+        'robotics hardware', 'robot hardware'
+    ),
+    'ai_robotics': (
+        'ai', 'artificial intelligence', 'machine learning', 'deep learning',
+        'neural network', 'ai robotics', 'intelligent robot'
+    )
+}
+
+# Topics assigned when any of their trigger phrases occurs in the text, in output order
+CONTENT_TOPIC_PATTERNS = {
+    # Company/Product specific topics
+    'ai_hardware': ('nvidia', 'gpu', 'ai chip'),
+    'autonomous_vehicles': ('tesla', 'self-driving', 'autonomous vehicle'),
+    'humanoid_robots': ('boston dynamics', 'atlas', 'spot'),
+    'space_robotics': ('spacex', 'nasa', 'space', 'satellite'),
+    'logistics_automation': ('amazon', 'warehouse', 'logistics'),
+    # Technology specific topics
+    'swarm_robotics': ('swarm', 'collective', 'multi-robot'),
+    'soft_robotics': ('soft robot', 'flexible', 'biomimetic'),
+    'medical_robotics': ('medical', 'surgical', 'healthcare'),
+    'agricultural_robotics': ('agriculture', 'farming', 'crop'),
+    'aerial_robotics': ('drone', 'uav', 'flying'),
+    'marine_robotics': ('underwater', 'marine', 'ocean'),
+    # Application specific topics
+    'industrial_automation': ('manufacturing', 'factory', 'production'),
+    'educational_robotics': ('education', 'learning', 'teaching'),
+    'research_publication': ('research', 'paper', 'study'),
+    'business_development': ('funding', 'investment', 'startup'),
+    'robotics_ethics': ('safety', 'regulation', 'ethics'),
+    # AI/ML specific topics
+    'deep_learning': ('deep learning', 'neural network', 'transformer'),
+    'reinforcement_learning': ('reinforcement learning', 'rl', 'q-learning'),
+    'computer_vision': ('computer vision', 'image recognition'),
+    'natural_language_processing': ('natural language', 'nlp', 'language model'),
+}
+
+# Robotics topics; a topic needs at least two of its keywords in the text
+ROBOTICS_TOPICS = {
+    'robotics_research': (
+        'research', 'paper', 'study', 'experiment', 'algorithm', 'methodology',
+        'innovation', 'breakthrough', 'discovery', 'analysis'
+    ),
+    'autonomous_systems': (
+        'autonomous', 'self-driving', 'autonomous vehicle', 'autonomous robot',
+        'autonomous system', 'autonomous navigation', 'autonomous control'
+    ),
+    'computer_vision': (
+        'computer vision', 'image processing', 'object detection', 'recognition',
+        'vision system', 'camera', 'sensor', 'perception'
+    ),
+    'machine_learning': (
+        'machine learning', 'deep learning', 'neural network', 'ai', 'artificial intelligence',
+        'training', 'model', 'algorithm', 'reinforcement learning'
+    ),
+    'industrial_robotics': (
+        'industrial', 'manufacturing', 'factory', 'automation', 'production',
+        'assembly', 'welding', 'painting', 'material handling'
+    ),
+    'service_robots': (
+        'service robot', 'domestic robot', 'household robot', 'cleaning robot',
+        'assistance robot', 'care robot', 'companion robot'
+    ),
+    'medical_robotics': (
+        'medical robot', 'surgical robot', 'healthcare robot', 'rehabilitation',
+        'prosthetics', 'medical device', 'surgery', 'therapy'
+    ),
+    'mobile_robotics': (
+        'mobile robot', 'wheeled robot', 'legged robot', 'flying robot', 'drone',
+        'uav', 'ugv', 'locomotion', 'navigation'
+    ),
+    'human_robot_interaction': (
+        'human robot interaction', 'hri', 'collaborative robot', 'cobot',
+        'human robot collaboration', 'interface', 'interaction'
+    ),
+    'soft_robotics': (
+        'soft robot', 'soft robotics', 'flexible robot', 'compliant robot',
+        'biomimetic', 'bio-inspired', 'elastic', 'deformable'
+    )
+}
+
+# Topics that confirm a keyword match in is_robotics_related
+ROBOTICS_RELEVANT_TOPICS = frozenset({
+    'robotics_research', 'autonomous_systems', 'computer_vision',
+    'industrial_robotics', 'service_robots', 'medical_robotics',
+    'mobile_robotics', 'human_robot_interaction', 'soft_robotics'
+})
+
+# Fallback topics used when neither table above matches, in output order
+GENERAL_TOPIC_PATTERNS = {
+    'robotics_general': ('robot', 'robotics', 'automation'),
+    'artificial_intelligence': ('ai', 'artificial intelligence', 'machine learning'),
+    'research_development': ('research', 'study', 'paper', 'development'),
+    'industrial_applications': ('industry', 'manufacturing', 'production'),
+    'technology_innovation': ('technology', 'innovation', 'breakthrough'),
+}
+
+
+def _build_pattern_automaton(*pattern_lists: Iterable[str]):
+    """Build an Aho-Corasick automaton over every pattern in the lists.
+    
+    Returns None without pyahocorasick or without any pattern (an empty automaton
+    cannot be searched), so callers fall back to substring scans.
+    """
+    patterns = [pattern for pattern_list in pattern_lists for pattern in pattern_list]
+    if ahocorasick is None or not patterns:
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+def _matched_labels(text_lower: str, pattern_table: Dict[str, Tuple[str, ...]], automaton) -> List[str]:
+    """Return the labels of the table with a pattern occurring in text_lower, in table order."""
+    if automaton is None:
+        # Substring scans stop at the first hit of each label
+        return [
+            label for label, patterns in pattern_table.items()
+            if any(pattern in text_lower for pattern in patterns)
+        ]
+    
+    matched = {pattern for _, pattern in automaton.iter(text_lower)}
+    if not matched:
+        return []
+    return [label for label, patterns in pattern_table.items() if not matched.isdisjoint(patterns)]
+
+
+def _contains_any(text_lower: str, patterns: Iterable[str], automaton) -> bool:
+    """Return True as soon as any pattern occurs as a substring of text_lower."""
+    if automaton is None:
+        return any(pattern in text_lower for pattern in patterns)
+    return next(automaton.iter(text_lower), None) is not None
+
+
+@lru_cache(maxsize=None)
+def _load_spacy_model(model_name: str):
+    """Load a spaCy model once per process so every KeywordExtractor shares it; None if missing."""
+    try:
+        nlp = spacy.load(model_name, exclude=SPACY_EXCLUDED_PIPES)
+        logger.info(f"Loaded spaCy model: {model_name}")
+        return nlp
+    except OSError:
+        logger.warning(f"Model {model_name} not found. Please install with: python -m spacy download {model_name}")
+        return None
+
+
+@lru_cache(maxsize=None)
+def _load_relevance_keywords(config_path: str) -> Tuple:
+    """Load the include and exclude keyword lists of a keywords config once per path.
+    
+    Returns:
+        Tuple of (keywords, keyword automaton, exclude keywords, exclude automaton),
+        with keywords lowercased
+    """
+    with open(config_path, 'r') as file:
+        config = yaml.safe_load(file)
+    
+    keywords = tuple(keyword.lower() for keyword in config.get('keywords') or [])
+    exclude_keywords = tuple(keyword.lower() for keyword in config.get('exclude_keywords') or [])
+    return (
+        keywords, _build_pattern_automaton(keywords),
+        exclude_keywords, _build_pattern_automaton(exclude_keywords)
+    )
+
+
+CATEGORY_AUTOMATON = _build_pattern_automaton(*CATEGORY_PATTERNS.values())
+
+# One bit per distinct pattern of the topic tables; a text's topic matches are
+# OR-ed into a single int and every topic is tested against its pattern mask
+TOPIC_PATTERN_BITS = {
+    pattern: 1 << index
+    for index, pattern in enumerate(dict.fromkeys(
+        pattern
+        for table in (CONTENT_TOPIC_PATTERNS, ROBOTICS_TOPICS, GENERAL_TOPIC_PATTERNS)
+        for patterns in table.values()
+        for pattern in patterns
+    ))
+}
+
+
+def _topic_masks(topic_table: Dict[str, Tuple[str, ...]]) -> Dict[str, int]:
+    """Map each topic of the table to the OR of its pattern bits."""
+    masks = {}
+    for topic, patterns in topic_table.items():
+        mask = 0
+        for pattern in patterns:
+            mask |= TOPIC_PATTERN_BITS[pattern]
+        masks[topic] = mask
+    return masks
+
+
+CONTENT_TOPIC_MASKS = _topic_masks(CONTENT_TOPIC_PATTERNS)
+ROBOTICS_TOPIC_MASKS = _topic_masks(ROBOTICS_TOPICS)
+GENERAL_TOPIC_MASKS = _topic_masks(GENERAL_TOPIC_PATTERNS)
+
+# All topic tables share one automaton so a text is scanned once for every topic
+TOPIC_AUTOMATON = _build_pattern_automaton(TOPIC_PATTERN_BITS)
+
+
+def _topic_pattern_mask(text_lower: str) -> int:
+    """Return the bitmask of topic patterns occurring as substrings of text_lower."""
+    seen = 0
+    if TOPIC_AUTOMATON is None:
+        for pattern, bit in TOPIC_PATTERN_BITS.items():
+            if pattern in text_lower:
+                seen |= bit
+    else:
+        for _, pattern in TOPIC_AUTOMATON.iter(text_lower):
+            seen |= TOPIC_PATTERN_BITS[pattern]
+    return seen
+
 class KeywordExtractor:
     """Extract keywords and topics from tweet content using NLP."""
     
@@ -23,13 +370,8 @@ class KeywordExtractor:
         Args:
             model_name: spaCy model to use
         """
-        try:
-            self.nlp = spacy.load(model_name)
-            logger.info(f"Loaded spaCy model: {model_name}")
-        except OSError:
-            logger.warning(f"Model {model_name} not found. Please install with: python -m spacy download {model_name}")
-            # Fallback to basic processing
-            self.nlp = None
+        # None falls back to basic processing
+        self.nlp = _load_spacy_model(model_name)
     
     def extract_keywords(self, text: str, max_keywords: int = 10) -> List[str]:
         """Extract keywords from text using NLP.
@@ -46,31 +388,44 @@ class KeywordExtractor:
         
         try:
             # Process text with spaCy
-            doc = self.nlp(text.lower())
-            
-            # Extract relevant tokens
-            keywords = []
-            for token in doc:
-                # Filter for nouns, proper nouns, and technical terms
-                if (token.pos_ in ['NOUN', 'PROPN'] and 
-                    not token.is_stop and 
-                    not token.is_punct and
-                    len(token.text) > 2 and
-                    not token.text.startswith('@') and
-                    not token.text.startswith('#')):
-                    
-                    # Lemmatize the token
-                    keyword = token.lemma_.lower()
-                    if keyword not in keywords:
-                        keywords.append(keyword)
-            
-            # Limit to max_keywords
-            return keywords[:max_keywords]
+            doc = self.nlp(text.lower(), disable=KEYWORD_DISABLED_PIPES)
+            return self._keywords_from_doc(doc, max_keywords)
             
         except Exception as e:
             logger.error(f"Error extracting keywords with spaCy: {e}")
             return self._basic_keyword_extraction(text, max_keywords)
     
+    def _keywords_from_doc(self, doc, max_keywords: int = 10) -> List[str]:
+        """Extract keywords from an already processed spaCy Doc.
+        
+        Args:
+            doc: spaCy Doc to analyze
+            max_keywords: Maximum number of keywords to return
+            
+        Returns:
+            List of extracted keywords
+        """
+        # Filter for nouns, proper nouns, and technical terms on the attribute array
+        attrs = doc.to_array(KEYWORD_TOKEN_ATTRS)
+        pos, is_stop, is_punct, length = attrs.T
+        candidates = np.flatnonzero(
+            ((pos == NOUN) | (pos == PROPN)) & (is_stop == 0) & (is_punct == 0) & (length > 2)
+        )
+        
+        # Dict keys give an order-preserving set of keywords
+        keywords = {}
+        for i in candidates.tolist():
+            # Stop once max_keywords distinct keywords are found
+            if len(keywords) >= max_keywords:
+                break
+            
+            token = doc[i]
+            if not token.text.startswith(('@', '#')):
+                # Lemmatize the token
+                keywords[token.lemma_.lower()] = None
+        
+        return list(keywords)
+    
     def _basic_keyword_extraction(self, text: str, max_keywords: int = 10) -> List[str]:
         """Basic keyword extraction without spaCy.
         
@@ -82,28 +437,11 @@ class KeywordExtractor:
             List of extracted keywords
         """
         try:
-            # Remove URLs, mentions, and hashtags
-            text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-            text = re.sub(r'@\w+', '', text)
-            text = re.sub(r'#\w+', '', text)
-            
-            # Split into words and filter
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-            
-            # Remove common stop words
-            stop_words = {
-                'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-                'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-                'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
-                'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her',
-                'us', 'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their'
-            }
-            
-            keywords = [word for word in words if word not in stop_words]
+            # Split into words in one pass, skipping URLs, mentions, and hashtags
+            words = (word.lower() for word in KEYWORD_TOKEN_RE.findall(text) if word)
             
-            # Count frequency and return most common
-            word_counts = Counter(keywords)
+            # Remove common stop words, count frequency and return most common
+            word_counts = Counter(word for word in words if word not in STOP_WORDS)
             return [word for word, count in word_counts.most_common(max_keywords)]
             
         except Exception as e:
@@ -116,29 +454,36 @@ class KeywordExtractor:
         Args:
             text: Input text to analyze
             
+        Returns:
+            List of extracted topics
+        """
+        return self._topics_from_lower(text.lower())
+    
+    def _topics_from_lower(self, text_lower: str) -> List[str]:
+        """Extract broader topics from already lowercased text.
+        
+        Args:
+            text_lower: Lowercased input text
+            
         Returns:
             List of extracted topics
         """
         try:
-            # Extract specific keywords first
-            keywords = self.extract_keywords(text, max_keywords=15)
+            # Find every topic pattern in one pass
+            matched = _topic_pattern_mask(text_lower)
             
             # Get content-specific topics
-            content_topics = self._extract_content_specific_topics(text, keywords)
+            content_topics = self._extract_content_specific_topics(matched)
             
             # Also check for robotics-specific topics but with more specific matching
-            robotics_topics = self._extract_robotics_topics(text, keywords)
+            robotics_topics = self._extract_robotics_topics(matched)
             
-            # Combine and deduplicate
-            all_topics = content_topics + robotics_topics
-            unique_topics = []
-            for topic in all_topics:
-                if topic not in unique_topics:
-                    unique_topics.append(topic)
+            # Combine and deduplicate, keeping first-seen order
+            unique_topics = list(dict.fromkeys(content_topics + robotics_topics))
             
             # If no specific topics found, add general robotics topics based on content
             if not unique_topics:
-                unique_topics = self._extract_general_topics(text, keywords)
+                unique_topics = self._extract_general_topics(matched)
             
             # Return top 5 most relevant topics
             return unique_topics[:5]
@@ -160,100 +505,8 @@ class KeywordExtractor:
             # Convert to lowercase for matching
             text_lower = text.lower()
             
-            # Extract keywords first
-            keywords = self.extract_keywords(text, max_keywords=20)
-            
-            # Define category patterns
-            category_patterns = {
-                'industrial_automation': [
-                    'industrial', 'automation', 'manufacturing', 'factory', 'assembly',
-                    'production', 'warehouse', 'logistics', 'supply chain', 'industry 4.0'
-                ],
-                'educational_robotics': [
-                    'education', 'learning', 'teaching', 'student', 'school', 'university',
-                    'academic', 'curriculum', 'robotics education', 'stem education'
-                ],
-                'robotics_ethics': [
-                    'ethics', 'ethical', 'responsible', 'safety', 'regulation', 'policy',
-                    'governance', 'bias', 'fairness', 'transparency', 'accountability'
-                ],
-                'agricultural_robotics': [
-                    'agriculture', 'farming', 'crop', 'harvest', 'irrigation', 'precision',
-                    'agtech', 'agri', 'farm', 'food production', 'horticulture'
-                ],
-                'medical_robotics': [
-                    'medical', 'healthcare', 'surgery', 'hospital', 'patient', 'diagnosis',
-                    'treatment', 'rehabilitation', 'prosthetics', 'telemedicine'
-                ],
-                'autonomous_vehicles': [
-                    'autonomous', 'self-driving', 'vehicle', 'car', 'transportation',
-                    'mobility', 'av', 'autonomous vehicle', 'driverless'
-                ],
-                'humanoid_robotics': [
-                    'humanoid', 'human-like', 'bipedal', 'anthropomorphic', 'humanoid robot',
-                    'android', 'humanoid robotics'
-                ],
-                'swarm_robotics': [
-                    'swarm', 'collective', 'multi-robot', 'distributed', 'coordination',
-                    'swarm robotics', 'collective behavior'
-                ],
-                'soft_robotics': [
-                    'soft', 'flexible', 'compliant', 'deformable', 'soft robotics',
-                    'soft robot', 'flexible robot'
-                ],
-                'research_robotics': [
-                    'research', 'study', 'experiment', 'investigation', 'analysis',
-                    'scientific', 'academic research', 'robotics research'
-                ],
-                'consumer_robotics': [
-                    'consumer', 'home', 'domestic', 'personal', 'household', 'entertainment',
-                    'consumer robot', 'home robot'
-                ],
-                'military_robotics': [
-                    'military', 'defense', 'security', 'weapon', 'combat', 'surveillance',
-                    'defense robotics', 'military robot'
-                ],
-                'space_robotics': [
-                    'space', 'satellite', 'rover', 'mars', 'nasa', 'spacecraft',
-                    'space robotics', 'space robot'
-                ],
-                'underwater_robotics': [
-                    'underwater', 'marine', 'ocean', 'submarine', 'aquatic', 'underwater robot',
-                    'marine robotics', 'ocean robotics'
-                ],
-                'aerial_robotics': [
-                    'aerial', 'drone', 'uav', 'quadcopter', 'flying', 'airborne',
-                    'aerial robotics', 'drone robotics'
-                ],
-                'collaborative_robotics': [
-                    'collaborative', 'cobot', 'human-robot', 'collaboration', 'cooperation',
-                    'collaborative robot', 'cobot'
-                ],
-                'mobile_robotics': [
-                    'mobile', 'navigation', 'localization', 'mapping', 'path planning',
-                    'mobile robot', 'autonomous navigation'
-                ],
-                'robotics_software': [
-                    'software', 'algorithm', 'programming', 'code', 'framework', 'library',
-                    'robotics software', 'robot software'
-                ],
-                'robotics_hardware': [
-                    'hardware', 'sensor', 'actuator', 'motor', 'controller', 'mechanical',
-                    'robotics hardware', 'robot hardware'
-                ],
-                'ai_robotics': [
-                    'ai', 'artificial intelligence', 'machine learning', 'deep learning',
-                    'neural network', 'ai robotics', 'intelligent robot'
-                ]
-            }
-            
-            # Match categories
-            categories = []
-            for category, patterns in category_patterns.items():
-                for pattern in patterns:
-                    if pattern in text_lower:
-                        categories.append(category)
-                        break  # Found one pattern for this category, move to next
+            # Match all category patterns in one pass, then keep the categories in table order
+            categories = _matched_labels(text_lower, CATEGORY_PATTERNS, CATEGORY_AUTOMATON)
             
             # If no specific categories found, add general
             if not categories:
@@ -265,123 +518,39 @@ class KeywordExtractor:
             logger.error(f"Error extracting categories: {e}")
             return ['robotics_general']
     
-    def _extract_content_specific_topics(self, text: str, keywords: List[str]) -> List[str]:
+    def _extract_content_specific_topics(self, matched: int) -> List[str]:
         """Extract content-specific topics based on the actual text content.
         
         Args:
-            text: Input text
-            keywords: Extracted keywords
+            matched: Bitmask of the topic patterns found in the lowercased text
             
         Returns:
             List of content-specific topics
         """
-        text_lower = text.lower()
-        topics = []
-        
-        # Company/Product specific topics
-        if any(word in text_lower for word in ['nvidia', 'gpu', 'ai chip']):
-            topics.append('ai_hardware')
-        if any(word in text_lower for word in ['tesla', 'self-driving', 'autonomous vehicle']):
-            topics.append('autonomous_vehicles')
-        if any(word in text_lower for word in ['boston dynamics', 'atlas', 'spot']):
-            topics.append('humanoid_robots')
-        if any(word in text_lower for word in ['spacex', 'nasa', 'space', 'satellite']):
-            topics.append('space_robotics')
-        if any(word in text_lower for word in ['amazon', 'warehouse', 'logistics']):
-            topics.append('logistics_automation')
-        
-        # Technology specific topics
-        if any(word in text_lower for word in ['swarm', 'collective', 'multi-robot']):
-            topics.append('swarm_robotics')
-        if any(word in text_lower for word in ['soft robot', 'flexible', 'biomimetic']):
-            topics.append('soft_robotics')
-        if any(word in text_lower for word in ['medical', 'surgical', 'healthcare']):
-            topics.append('medical_robotics')
-        if any(word in text_lower for word in ['agriculture', 'farming', 'crop']):
-            topics.append('agricultural_robotics')
-        if any(word in text_lower for word in ['drone', 'uav', 'flying']):
-            topics.append('aerial_robotics')
-        if any(word in text_lower for word in ['underwater', 'marine', 'ocean']):
-            topics.append('marine_robotics')
-        
-        # Application specific topics
-        if any(word in text_lower for word in ['manufacturing', 'factory', 'production']):
-            topics.append('industrial_automation')
-        if any(word in text_lower for word in ['education', 'learning', 'teaching']):
-            topics.append('educational_robotics')
-        if any(word in text_lower for word in ['research', 'paper', 'study']):
-            topics.append('research_publication')
-        if any(word in text_lower for word in ['funding', 'investment', 'startup']):
-            topics.append('business_development')
-        if any(word in text_lower for word in ['safety', 'regulation', 'ethics']):
-            topics.append('robotics_ethics')
-        
-        # AI/ML specific topics
-        if any(word in text_lower for word in ['deep learning', 'neural network', 'transformer']):
-            topics.append('deep_learning')
-        if any(word in text_lower for word in ['reinforcement learning', 'rl', 'q-learning']):
-            topics.append('reinforcement_learning')
-        if any(word in text_lower for word in ['computer vision', 'image recognition']):
-            topics.append('computer_vision')
-        if any(word in text_lower for word in ['natural language', 'nlp', 'language model']):
-            topics.append('natural_language_processing')
-        
-        return topics
+        return [topic for topic, mask in CONTENT_TOPIC_MASKS.items() if matched & mask]
     
-    def _extract_robotics_topics(self, text: str, keywords: List[str]) -> List[str]:
+    def _extract_robotics_topics(self, matched: int) -> List[str]:
         """Extract robotics-specific topics with more precise matching.
         
         Args:
-            text: Input text
-            keywords: Extracted keywords
+            matched: Bitmask of the topic patterns found in the lowercased text
             
         Returns:
             List of robotics topics
         """
-        topics = self._load_robotics_topics()
-        text_lower = text.lower()
-        matched_topics = []
-        
-        # More precise matching - require multiple keyword matches
-        for topic, keywords_list in topics.items():
-            matches = 0
-            for keyword in keywords_list:
-                if keyword.lower() in text_lower:
-                    matches += 1
-                    if matches >= 2:  # Require at least 2 keyword matches
-                        matched_topics.append(topic)
-                        break
-        
-        return matched_topics
+        # More precise matching - require at least 2 keyword matches
+        return [topic for topic, mask in ROBOTICS_TOPIC_MASKS.items() if (matched & mask).bit_count() >= 2]
     
-    def _extract_general_topics(self, text: str, keywords: List[str]) -> List[str]:
+    def _extract_general_topics(self, matched: int) -> List[str]:
         """Extract general topics when no specific topics are found.
         
         Args:
-            text: Input text
-            keywords: Extracted keywords
+            matched: Bitmask of the topic patterns found in the lowercased text
             
         Returns:
             List of general topics
         """
-        text_lower = text.lower()
-        topics = []
-        
-        # Basic robotics categorization
-        if any(word in text_lower for word in ['robot', 'robotics', 'automation']):
-            topics.append('robotics_general')
-        
-        if any(word in text_lower for word in ['ai', 'artificial intelligence', 'machine learning']):
-            topics.append('artificial_intelligence')
-        
-        if any(word in text_lower for word in ['research', 'study', 'paper', 'development']):
-            topics.append('research_development')
-        
-        if any(word in text_lower for word in ['industry', 'manufacturing', 'production']):
-            topics.append('industrial_applications')
-        
-        if any(word in text_lower for word in ['technology', 'innovation', 'breakthrough']):
-            topics.append('technology_innovation')
+        topics = [topic for topic, mask in GENERAL_TOPIC_MASKS.items() if matched & mask]
         
         # Ensure we return at least one topic
         if not topics:
@@ -389,81 +558,32 @@ class KeywordExtractor:
         
         return topics
     
-    def _load_robotics_topics(self) -> Dict[str, List[str]]:
-        """Load robotics-specific topic keywords.
+    def analyze_sentiment(self, text: str) -> Dict[str, float]:
+        """Basic sentiment analysis.
         
+        Args:
+            text: Input text to analyze
+            
         Returns:
-            Dictionary mapping topics to keyword lists
+            Dictionary with sentiment scores
         """
-        return {
-            'robotics_research': [
-                'research', 'paper', 'study', 'experiment', 'algorithm', 'methodology',
-                'innovation', 'breakthrough', 'discovery', 'analysis'
-            ],
-            'autonomous_systems': [
-                'autonomous', 'self-driving', 'autonomous vehicle', 'autonomous robot',
-                'autonomous system', 'autonomous navigation', 'autonomous control'
-            ],
-            'computer_vision': [
-                'computer vision', 'image processing', 'object detection', 'recognition',
-                'vision system', 'camera', 'sensor', 'perception'
-            ],
-            'machine_learning': [
-                'machine learning', 'deep learning', 'neural network', 'AI', 'artificial intelligence',
-                'training', 'model', 'algorithm', 'reinforcement learning'
-            ],
-            'industrial_robotics': [
-                'industrial', 'manufacturing', 'factory', 'automation', 'production',
-                'assembly', 'welding', 'painting', 'material handling'
-            ],
-            'service_robots': [
-                'service robot', 'domestic robot', 'household robot', 'cleaning robot',
-                'assistance robot', 'care robot', 'companion robot'
-            ],
-            'medical_robotics': [
-                'medical robot', 'surgical robot', 'healthcare robot', 'rehabilitation',
-                'prosthetics', 'medical device', 'surgery', 'therapy'
-            ],
-            'mobile_robotics': [
-                'mobile robot', 'wheeled robot', 'legged robot', 'flying robot', 'drone',
-                'UAV', 'UGV', 'locomotion', 'navigation'
-            ],
-            'human_robot_interaction': [
-                'human robot interaction', 'HRI', 'collaborative robot', 'cobot',
-                'human robot collaboration', 'interface', 'interaction'
-            ],
-            'soft_robotics': [
-                'soft robot', 'soft robotics', 'flexible robot', 'compliant robot',
-                'biomimetic', 'bio-inspired', 'elastic', 'deformable'
-            ]
-        }
+        return self._sentiment_from_words(text.lower().split())
     
-    def analyze_sentiment(self, text: str) -> Dict[str, float]:
-        """Basic sentiment analysis.
+    def _sentiment_from_words(self, words: List[str]) -> Dict[str, float]:
+        """Basic sentiment analysis over already lowercased, whitespace-split words.
         
         Args:
-            text: Input text to analyze
+            words: Lowercased words of the text
             
         Returns:
             Dictionary with sentiment scores
         """
         try:
             # Simple keyword-based sentiment analysis
-            positive_words = {
-                'amazing', 'awesome', 'great', 'excellent', 'outstanding', 'brilliant',
-                'innovative', 'breakthrough', 'exciting', 'promising', 'successful',
-                'improved', 'better', 'faster', 'stronger', 'efficient', 'effective'
-            }
-            
-            negative_words = {
-                'terrible', 'awful', 'bad', 'poor', 'disappointing', 'failed',
-                'broken', 'problem', 'issue', 'difficult', 'challenging', 'expensive',
-                'slow', 'weak', 'inefficient', 'unreliable'
-            }
-            
-            words = text.lower().split()
-            positive_count = sum(1 for word in words if word in positive_words)
-            negative_count = sum(1 for word in words if word in negative_words)
+            # Count the tokens once, then probe the counts with the short word lists
+            word_counts = Counter(words)
+            positive_count = sum(word_counts[word] for word in POSITIVE_WORDS)
+            negative_count = sum(word_counts[word] for word in NEGATIVE_WORDS)
             
             total_words = len(words)
             if total_words == 0:
@@ -496,26 +616,38 @@ class KeywordExtractor:
             return []
         
         try:
-            doc = self.nlp(text)
-            entities = []
-            
-            for ent in doc.ents:
-                entities.append({
-                    'text': ent.text,
-                    'label': ent.label_,
-                    'start': ent.start_char,
-                    'end': ent.end_char
-                })
-            
-            return entities
+            return self._entities_from_doc(self.nlp(text, disable=ENTITY_DISABLED_PIPES))
             
         except Exception as e:
             logger.error(f"Error extracting entities: {e}")
             return []
     
+    def _entities_from_doc(self, doc) -> List[Dict]:
+        """Extract named entities from an already processed spaCy Doc.
+        
+        Args:
+            doc: spaCy Doc to analyze
+            
+        Returns:
+            List of entity dictionaries
+        """
+        return [
+            {
+                'text': ent.text,
+                'label': ent.label_,
+                'start': ent.start_char,
+                'end': ent.end_char
+            }
+            for ent in doc.ents
+        ]
+    
     def is_robotics_related(self, text: str, config_path: str = "config/keywords.yaml") -> bool:
         """Check if text is robotics-related based on keywords.
         
+        The keyword lists decide: any exclude keyword rejects the text and at
+        least one include keyword is required. Only texts that pass both are
+        additionally required to have a robotics topic.
+        
         Args:
             text: Input text to check
             config_path: Path to keywords configuration file
@@ -523,43 +655,37 @@ class KeywordExtractor:
         Returns:
             True if robotics-related, False otherwise
         """
-        try:
-            # Load configuration
-            with open(config_path, 'r') as file:
-                config = yaml.safe_load(file)
-            
-            keywords = config.get('keywords', [])
-            exclude_keywords = config.get('exclude_keywords', [])
+        return self._is_robotics_from_lower(text.lower(), config_path)
+    
+    def _is_robotics_from_lower(self, text_lower: str, config_path: str = "config/keywords.yaml",
+                                topics: Optional[List[str]] = None) -> bool:
+        """Check if already lowercased text is robotics-related based on keywords.
+        
+        Args:
+            text_lower: Lowercased input text
+            config_path: Path to keywords configuration file
+            topics: Topics already extracted from the text, computed here if None
             
-            text_lower = text.lower()
+        Returns:
+            True if robotics-related, False otherwise
+        """
+        try:
+            # Load configuration (parsed and compiled once per config file)
+            keywords, keyword_automaton, exclude_keywords, exclude_automaton = _load_relevance_keywords(config_path)
             
             # Check for exclusion keywords first
-            for exclude_keyword in exclude_keywords:
-                if exclude_keyword.lower() in text_lower:
-                    return False
-            
-            # Check for inclusion keywords - must have at least one robotics-specific keyword
-            robotics_keywords_found = 0
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    robotics_keywords_found += 1
+            if _contains_any(text_lower, exclude_keywords, exclude_automaton):
+                return False
             
             # Must have at least one robotics keyword to be considered robotics-related
-            if robotics_keywords_found == 0:
+            if not _contains_any(text_lower, keywords, keyword_automaton):
                 return False
             
             # Additional check: ensure topics are actually robotics-related
-            topics = self.extract_topics(text)
-            if topics:
-                # Check if any of the extracted topics are robotics-related
-                robotics_topics = [
-                    'robotics_research', 'autonomous_systems', 'computer_vision',
-                    'industrial_robotics', 'service_robots', 'medical_robotics',
-                    'mobile_robotics', 'human_robot_interaction', 'soft_robotics'
-                ]
-                has_robotics_topic = any(topic in topics for topic in robotics_topics)
-                if not has_robotics_topic:
-                    return False
+            if topics is None:
+                topics = self._topics_from_lower(text_lower)
+            if topics and ROBOTICS_RELEVANT_TOPICS.isdisjoint(topics):
+                return False
             
             return True
             
@@ -573,17 +699,80 @@ class KeywordExtractor:
         Args:
             text: Input text to analyze
             
+        Returns:
+            Dictionary with analysis results
+        """
+        return self.analyze_many([text])[0]
+    
+    def analyze_many(self, texts: List[str], n_process: int = 1) -> List[Dict]:
+        """Get content analysis summaries for many texts, batching them through spaCy.
+        
+        Keywords come from the lowercased texts and entities from the original
+        texts, as in extract_keywords and extract_entities, with each batch
+        running only the components its extraction needs.
+        
+        Args:
+            texts: Input texts to analyze
+            n_process: spaCy worker processes for bulk runs (-1 for one per CPU);
+                ignored for fewer than MULTIPROCESS_MIN_TEXTS texts
+            
+        Returns:
+            List of analysis result dictionaries, one per text
+        """
+        if len(texts) < MULTIPROCESS_MIN_TEXTS:
+            n_process = 1
+        
+        keyword_docs = entity_docs = [None] * len(texts)
+        if self.nlp:
+            try:
+                keyword_docs = list(self.nlp.pipe(
+                    (text.lower() for text in texts), batch_size=SPACY_BATCH_SIZE,
+                    n_process=n_process, disable=KEYWORD_DISABLED_PIPES
+                ))
+                entity_docs = list(self.nlp.pipe(
+                    texts, batch_size=SPACY_BATCH_SIZE,
+                    n_process=n_process, disable=ENTITY_DISABLED_PIPES
+                ))
+            except Exception as e:
+                logger.error(f"Error processing texts with spaCy: {e}")
+                keyword_docs = entity_docs = [None] * len(texts)
+        
+        return [
+            self._summarize(text, keyword_doc, entity_doc)
+            for text, keyword_doc, entity_doc in zip(texts, keyword_docs, entity_docs)
+        ]
+    
+    def _summarize(self, text: str, keyword_doc, entity_doc) -> Dict:
+        """Build the content analysis summary for one text.
+        
+        Args:
+            text: Input text to analyze
+            keyword_doc: spaCy Doc for the lowercased text, or None to use basic processing
+            entity_doc: spaCy Doc for the original text, or None to skip entities
+            
         Returns:
             Dictionary with analysis results
         """
         try:
+            if keyword_doc is None:
+                keywords = self._basic_keyword_extraction(text)
+                entities = []
+            else:
+                keywords = self._keywords_from_doc(keyword_doc)
+                entities = self._entities_from_doc(entity_doc)
+            
+            # Lowercase and split once for all the string-matching analyses
+            text_lower = text.lower()
+            words = text_lower.split()
+            topics = self._topics_from_lower(text_lower)
+            
             return {
-                'keywords': self.extract_keywords(text),
-                'topics': self.extract_topics(text),
-                'sentiment': self.analyze_sentiment(text),
-                'entities': self.extract_entities(text),
-                'is_robotics_related': self.is_robotics_related(text),
-                'word_count': len(text.split()),
+                'keywords': keywords,
+                'topics': topics,
+                'sentiment': self._sentiment_from_words(words),
+                'entities': entities,
+                'is_robotics_related': self._is_robotics_from_lower(text_lower, topics=topics),
+                'word_count': len(words),
                 'character_count': len(text)
             }
             
@@ -597,4 +786,4 @@ class KeywordExtractor:
                 'is_robotics_related': False,
                 'word_count': 0,
                 'character_count': 0
-            } 
\ No newline at end of file
+            }
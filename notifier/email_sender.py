@@ -3,12 +3,19 @@ Email notification module for Robotics Radar.
 Sends notifications via SMTP email.
 """
 
+import asyncio
+import atexit
+import html
 import logging
 import os
 import smtplib
+import socket
+import ssl
+import threading
+import weakref
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import sys
 
@@ -17,10 +24,127 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from storage.database import Article
 
+try:
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Messages sent over one SMTP connection before it is replaced with a fresh one
+SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+
+# Seconds to wait on connect/TLS handshake/commands before giving up
+SMTP_TIMEOUT = 10
+
+# Email HTML skeletons, filled in with str.format (hence the doubled CSS braces)
+_ARTICLES_HTML_HEADER = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <style>
+                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+                .header {{ background-color: #1da1f2; color: white; padding: 20px; text-align: center; }}
+                .tweet {{ border: 1px solid #ddd; margin: 10px 0; padding: 15px; border-radius: 8px; }}
+                .author {{ font-weight: bold; color: #1da1f2; }}
+                .score {{ color: #666; font-size: 0.9em; }}
+                .metrics {{ color: #666; font-size: 0.9em; }}
+                .link {{ color: #1da1f2; text-decoration: none; }}
+                .footer {{ background-color: #f8f9fa; padding: 20px; text-align: center; margin-top: 20px; }}
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>🤖 Robotics Radar</h1>
+                <p>Top {count} Robotics Articles</p>
+            </div>
+            
+            <div style="padding: 20px;">
+        """
+
+_ANALYTICS_HTML_HEADER = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <style>
+                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+                .header {{ background-color: #1da1f2; color: white; padding: 20px; text-align: center; }}
+                .stats {{ display: flex; justify-content: space-around; margin: 20px 0; }}
+                .stat {{ text-align: center; padding: 15px; background-color: #f8f9fa; border-radius: 8px; }}
+                .stat-number {{ font-size: 2em; font-weight: bold; color: #1da1f2; }}
+                .stat-label {{ color: #666; }}
+                .section {{ margin: 20px 0; }}
+                .footer {{ background-color: #f8f9fa; padding: 20px; text-align: center; margin-top: 20px; }}
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>📊 Robotics Radar Analytics</h1>
+                <p>Daily Report</p>
+            </div>
+            
+            <div style="padding: 20px;">
+                <div class="stats">
+                    <div class="stat">
+                        <div class="stat-number">{total_articles:,}</div>
+                        <div class="stat-label">Total Articles</div>
+                    </div>
+                    <div class="stat">
+                        <div class="stat-number">{total_authors:,}</div>
+                        <div class="stat-label">Total Authors</div>
+                    </div>
+                    <div class="stat">
+                        <div class="stat-number">{avg_score:.2f}</div>
+                        <div class="stat-label">Avg Score</div>
+                    </div>
+                    <div class="stat">
+                        <div class="stat-number">{recent_articles:,}</div>
+                        <div class="stat-label">Recent (24h)</div>
+                    </div>
+                </div>
+        """
+
+_HTML_FOOTER = """
+            </div>
+            
+            <div class="footer">
+                <p>Robotics Radar - Automated robotics content curation</p>
+                <p>Generated on {generated_at}</p>
+            </div>
+        </body>
+        </html>
+        """
+
+# Notifiers whose pooled SMTP connections are closed at interpreter exit; weak so
+# a discarded notifier can still be garbage collected
+_OPEN_NOTIFIERS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_notifiers():
+    """Close the pooled connections of every notifier still alive at exit."""
+    for notifier in list(_OPEN_NOTIFIERS):
+        notifier.close()
+        notifier._discard_async_connection()
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to at most ``limit`` characters, marking the cut with an ellipsis.
+    
+    Args:
+        text: Text to shorten
+        limit: Maximum number of characters kept from ``text``
+        
+    Returns:
+        ``text`` unchanged if it fits, otherwise its first ``limit`` characters plus "..."
+    """
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
 class EmailNotifier:
     """Email notifier for sending top articles via SMTP."""
     
@@ -28,10 +152,26 @@ class EmailNotifier:
         """Initialize email notifier."""
         self.smtp_server = os.getenv('SMTP_SERVER')
         self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
+        # Implicit TLS (port 465) skips the EHLO/STARTTLS/EHLO upgrade round-trip
+        self.smtp_use_ssl = os.getenv(
+            'SMTP_USE_SSL', str(self.smtp_port == 465)
+        ).strip().lower() in ('true', '1', 'yes')
         self.smtp_username = os.getenv('SMTP_USERNAME')
         self.smtp_password = os.getenv('SMTP_PASSWORD')
         self.recipients = self._get_recipients()
         
+        # Logged-in SMTP connection kept open between sends
+        self._conn: Optional[smtplib.SMTP] = None
+        self._msgs_on_conn = 0
+        self._conn_lock = threading.Lock()
+        _OPEN_NOTIFIERS.add(self)
+        
+        # Async counterpart, bound to the event loop that opened it
+        self._aconn = None
+        self._aconn_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._amsgs_on_conn = 0
+        self._aconn_lock: Optional[asyncio.Lock] = None
+        
     def _get_recipients(self) -> List[str]:
         """Get list of email recipients from environment.
         
@@ -81,6 +221,141 @@ class EmailNotifier:
         
         return message
     
+    def _get_connection(self, check_alive: bool = True) -> smtplib.SMTP:
+        """Get a logged-in SMTP connection, reusing the open one while it is alive.
+        
+        Args:
+            check_alive: Probe the open connection with NOOP before reusing it
+            
+        Returns:
+            SMTP connection ready to send
+        """
+        if self._conn is not None and self._msgs_on_conn < SMTP_MAX_MESSAGES_PER_CONNECTION:
+            if not check_alive:
+                return self._conn
+            try:
+                if self._conn.noop()[0] == 250:
+                    return self._conn
+            except (smtplib.SMTPException, OSError):
+                # Server closed the idle connection; open a new one below
+                pass
+        
+        self.close()
+        
+        # Connect to SMTP server
+        context = ssl.create_default_context()
+        if self.smtp_use_ssl:
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port,
+                                      context=context, timeout=SMTP_TIMEOUT)
+        else:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT)
+            server.starttls(context=context)
+        
+        # Login
+        server.login(self.smtp_username, self.smtp_password)
+        
+        self._conn = server
+        self._msgs_on_conn = 0
+        return server
+    
+    def close(self):
+        """Close the pooled SMTP connection, if one is open."""
+        if self._conn is None:
+            return
+        
+        try:
+            self._conn.quit()
+        except (smtplib.SMTPException, OSError):
+            self._conn.close()
+        finally:
+            self._conn = None
+    
+    async def _aget_connection(self):
+        """Get a logged-in aiosmtplib connection, reusing the open one while it is alive.
+        
+        Must be called with ``self._aconn_lock`` held.
+        
+        Returns:
+            aiosmtplib.SMTP connection ready to send
+        """
+        if (self._aconn is not None and self._aconn.is_connected
+                and self._amsgs_on_conn < SMTP_MAX_MESSAGES_PER_CONNECTION):
+            try:
+                if (await self._aconn.noop()).code == 250:
+                    return self._aconn
+            except (aiosmtplib.SMTPException, OSError):
+                # Server closed the idle connection; open a new one below
+                pass
+        
+        await self.aclose()
+        
+        server = aiosmtplib.SMTP(
+            hostname=self.smtp_server,
+            port=self.smtp_port,
+            use_tls=self.smtp_use_ssl,
+            start_tls=not self.smtp_use_ssl,
+            tls_context=ssl.create_default_context(),
+            timeout=SMTP_TIMEOUT,
+        )
+        await server.connect()
+        await server.login(self.smtp_username, self.smtp_password)
+        
+        self._aconn = server
+        self._amsgs_on_conn = 0
+        return server
+    
+    async def aclose(self):
+        """Close the pooled async SMTP connection, if one is open."""
+        if self._aconn is None:
+            return
+        
+        try:
+            await self._aconn.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            self._aconn.close()
+        finally:
+            self._aconn = None
+    
+    def _discard_async_connection(self):
+        """Drop the pooled async connection without awaiting a QUIT.
+        
+        Used when its event loop has finished, so the connection can no longer
+        be awaited but must not stay open.
+        """
+        if self._aconn is None:
+            return
+        
+        conn, self._aconn = self._aconn, None
+        transport = conn.transport
+        try:
+            conn.close()
+        except RuntimeError:
+            # The transport's event loop is closed and cannot run its close callback;
+            # end the TCP session now, the socket is freed with the transport
+            sock = transport.get_extra_info('socket') if transport is not None else None
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+    
+    def _deliver(self, message: MIMEMultipart, to_addrs: Optional[List[str]] = None,
+                 check_alive: bool = True):
+        """Send one message on the pooled connection. Caller must hold ``self._conn_lock``.
+        
+        Args:
+            message: MIME message object
+            to_addrs: Envelope recipients; defaults to the message's To/Cc/Bcc headers
+            check_alive: Probe a reused connection with NOOP first
+        """
+        try:
+            self._get_connection(check_alive).send_message(message, to_addrs=to_addrs)
+        except smtplib.SMTPServerDisconnected:
+            # Dropped between the liveness check and the send; retry once on a new connection
+            self.close()
+            self._get_connection().send_message(message, to_addrs=to_addrs)
+        self._msgs_on_conn += 1
+    
     def _send_email(self, message: MIMEMultipart) -> bool:
         """Send email via SMTP.
         
@@ -91,16 +366,77 @@ class EmailNotifier:
             True if email sent successfully
         """
         try:
-            # Connect to SMTP server
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
+            with self._conn_lock:
+                self._deliver(message)
+            
+            logger.info(f"Email sent successfully to {len(self.recipients)} recipients")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error sending email: {e}")
+            return False
+    
+    def send_bulk(self, per_recipient_messages: List[Tuple[str, MIMEMultipart]]) -> int:
+        """Send individually addressed messages over one pooled SMTP connection.
+        
+        TLS and AUTH are paid once for the whole batch; the connection is
+        replaced every SMTP_MAX_MESSAGES_PER_CONNECTION messages.
+        
+        Args:
+            per_recipient_messages: (recipient address, message) pairs
+            
+        Returns:
+            Number of messages sent successfully
+        """
+        if not all([self.smtp_server, self.smtp_username, self.smtp_password]):
+            return 0
+        
+        sent = 0
+        check_alive = True
+        with self._conn_lock:
+            for recipient, message in per_recipient_messages:
+                try:
+                    # Back-to-back sends skip the NOOP probe; a dropped connection is retried in _deliver
+                    self._deliver(message, to_addrs=[recipient], check_alive=check_alive)
+                    sent += 1
+                    check_alive = False
+                except Exception as e:
+                    logger.error(f"Error sending email to {recipient}: {e}")
+                    # The failure may have left the session mid-transaction; probe before reusing it
+                    check_alive = True
+        
+        logger.info(f"Bulk email sent {sent}/{len(per_recipient_messages)} messages")
+        return sent
+    
+    async def _asend_email(self, message: MIMEMultipart) -> bool:
+        """Send email via SMTP without blocking the running event loop.
+        
+        Args:
+            message: MIME message object
             
-            # Login
-            server.login(self.smtp_username, self.smtp_password)
+        Returns:
+            True if email sent successfully
+        """
+        if aiosmtplib is None:
+            logger.error("aiosmtplib is not installed; async email sending is unavailable")
+            return False
+        
+        try:
+            loop = asyncio.get_running_loop()
+            if self._aconn_loop is not loop:
+                # A connection or lock from another (finished) loop cannot be awaited here
+                self._discard_async_connection()
+                self._aconn_loop = loop
+                self._aconn_lock = asyncio.Lock()
             
-            # Send email
-            server.send_message(message)
-            server.quit()
+            async with self._aconn_lock:
+                try:
+                    await (await self._aget_connection()).send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # Dropped between the liveness check and the send; retry once on a new connection
+                    await self.aclose()
+                    await (await self._aget_connection()).send_message(message)
+                self._amsgs_on_conn += 1
             
             logger.info(f"Email sent successfully to {len(self.recipients)} recipients")
             return True
@@ -109,6 +445,26 @@ class EmailNotifier:
             logger.error(f"Error sending email: {e}")
             return False
     
+    def _create_top_articles_message(self, articles: List[Article]) -> MIMEMultipart:
+        """Build the top articles email.
+        
+        Args:
+            articles: List of top articles to send
+            
+        Returns:
+            MIME message object
+        """
+        subject = f"🤖 Robotics Radar - Top {len(articles)} Articles"
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Create HTML content
+        html_content = self._create_html_content(articles, generated_at)
+        
+        # Create plain text content
+        text_content = self._create_text_content(articles, generated_at)
+        
+        return self._create_message(subject, html_content, text_content)
+    
     def send_top_articles(self, articles: List[Article]) -> bool:
         """Send top articles notification via email.
         
@@ -122,110 +478,97 @@ class EmailNotifier:
             return False
         
         try:
-            subject = f"🤖 Robotics Radar - Top {len(articles)} Articles"
-            
-            # Create HTML content
-            html_content = self._create_html_content(articles)
-            
-            # Create plain text content
-            text_content = self._create_text_content(articles)
-            
-            # Create and send message
-            message = self._create_message(subject, html_content, text_content)
+            message = self._create_top_articles_message(articles)
             return self._send_email(message)
             
         except Exception as e:
             logger.error(f"Error creating top articles email: {e}")
             return False
     
-    def _create_html_content(self, articles: List[Article]) -> str:
+    async def asend_top_articles(self, articles: List[Article]) -> bool:
+        """Send top articles notification via email from async code.
+        
+        Same email as :meth:`send_top_articles`, but the SMTP dialog runs on
+        the event loop (aiosmtplib) instead of blocking it. The connection is
+        kept open for later sends; call ``await notifier.aclose()`` before the
+        event loop finishes to end it with a proper QUIT.
+        
+        Args:
+            articles: List of top articles to send
+            
+        Returns:
+            True if email sent successfully
+        """
+        if not self.is_available() or not articles:
+            return False
+        
+        try:
+            message = self._create_top_articles_message(articles)
+        except Exception as e:
+            logger.error(f"Error creating top articles email: {e}")
+            return False
+        
+        return await self._asend_email(message)
+    
+    def _create_html_content(self, articles: List[Article], generated_at: str) -> str:
         """Create HTML content for email.
         
         Args:
             articles: List of articles
+            generated_at: Formatted timestamp shown in the footer
             
         Returns:
             HTML content string
         """
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .header {{ background-color: #1da1f2; color: white; padding: 20px; text-align: center; }}
-                .tweet {{ border: 1px solid #ddd; margin: 10px 0; padding: 15px; border-radius: 8px; }}
-                .author {{ font-weight: bold; color: #1da1f2; }}
-                .score {{ color: #666; font-size: 0.9em; }}
-                .metrics {{ color: #666; font-size: 0.9em; }}
-                .link {{ color: #1da1f2; text-decoration: none; }}
-                .footer {{ background-color: #f8f9fa; padding: 20px; text-align: center; margin-top: 20px; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>🤖 Robotics Radar</h1>
-                <p>Top {len(articles)} Robotics Articles</p>
-            </div>
-            
-            <div style="padding: 20px;">
-        """
+        parts = [_ARTICLES_HTML_HEADER.format(count=len(articles))]
         
         for i, article in enumerate(articles, 1):
-            # Truncate text if too long
-            text = article.text[:300] + "..." if len(article.text) > 300 else article.text
+            # Truncate text if too long, then escape so markup in posts can't break the layout
+            text = html.escape(_truncate(article.text, 300))
             
-            html += f"""
+            parts.append(f"""
                 <div class="tweet">
-                    <div class="author">#{i} {article.author_username}</div>
+                    <div class="author">#{i} {html.escape(article.author_username)}</div>
                     <div style="margin: 10px 0;">{text}</div>
                     <div class="metrics">
                         ❤️ {article.likes:,} | 🔄 {article.retweets:,} | 💬 {article.replies:,}
                     </div>
                     <div class="score">Score: {article.score:.2f}</div>
                     <div style="margin-top: 10px;">
-                        <a href="{article.url}" class="link">Read Article</a>
+                        <a href="{html.escape(article.url)}" class="link">Read Article</a>
                     </div>
                 </div>
-            """
-        
-        html += f"""
-            </div>
-            
-            <div class="footer">
-                <p>Robotics Radar - Automated robotics content curation</p>
-                <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-        </body>
-        </html>
-        """
+            """)
         
-        return html
+        parts.append(_HTML_FOOTER.format(generated_at=generated_at))
+        return "".join(parts)
     
-    def _create_text_content(self, articles: List[Article]) -> str:
+    def _create_text_content(self, articles: List[Article], generated_at: str) -> str:
         """Create plain text content for email.
         
         Args:
             articles: List of articles
+            generated_at: Formatted timestamp shown in the footer
             
         Returns:
             Plain text content string
         """
-        text = f"🤖 Robotics Radar - Top {len(articles)} Articles\n"
-        text += "=" * 50 + "\n\n"
+        parts = [
+            f"🤖 Robotics Radar - Top {len(articles)} Articles\n",
+            "=" * 50 + "\n\n",
+        ]
         
         for i, article in enumerate(articles, 1):
             # Truncate text if too long
-            article_text = article.text[:200] + "..." if len(article.text) > 200 else article.text
+            article_text = _truncate(article.text, 200)
             
-            text += f"{i}. {article.author_username}\n"
-            text += f"   {article_text}\n"
-            text += f"   Score: {article.score:.2f} | ❤️ {article.likes:,} | 🔄 {article.retweets:,} | 💬 {article.replies:,}\n"
-            text += f"   View: {article.url}\n\n"
+            parts.append(f"{i}. {article.author_username}\n")
+            parts.append(f"   {article_text}\n")
+            parts.append(f"   Score: {article.score:.2f} | ❤️ {article.likes:,} | 🔄 {article.retweets:,} | 💬 {article.replies:,}\n")
+            parts.append(f"   View: {article.url}\n\n")
         
-        text += f"\nGenerated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        return text
+        parts.append(f"\nGenerated on {generated_at}")
+        return "".join(parts)
     
     def send_analytics_report(self, stats: Dict) -> bool:
         """Send analytics report via email.
@@ -241,12 +584,13 @@ class EmailNotifier:
         
         try:
             subject = "📊 Robotics Radar - Daily Analytics Report"
+            generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             
             # Create HTML content
-            html_content = self._create_analytics_html(stats)
+            html_content = self._create_analytics_html(stats, generated_at)
             
             # Create plain text content
-            text_content = self._create_analytics_text(stats)
+            text_content = self._create_analytics_text(stats, generated_at)
             
             # Create and send message
             message = self._create_message(subject, html_content, text_content)
@@ -256,135 +600,92 @@ class EmailNotifier:
             logger.error(f"Error creating analytics email: {e}")
             return False
     
-    def _create_analytics_html(self, stats: Dict) -> str:
+    def _create_analytics_html(self, stats: Dict, generated_at: str) -> str:
         """Create HTML content for analytics report.
         
         Args:
             stats: Analytics statistics
+            generated_at: Formatted timestamp shown in the footer
             
         Returns:
             HTML content string
         """
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .header {{ background-color: #1da1f2; color: white; padding: 20px; text-align: center; }}
-                .stats {{ display: flex; justify-content: space-around; margin: 20px 0; }}
-                .stat {{ text-align: center; padding: 15px; background-color: #f8f9fa; border-radius: 8px; }}
-                .stat-number {{ font-size: 2em; font-weight: bold; color: #1da1f2; }}
-                .stat-label {{ color: #666; }}
-                .section {{ margin: 20px 0; }}
-                .footer {{ background-color: #f8f9fa; padding: 20px; text-align: center; margin-top: 20px; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>📊 Robotics Radar Analytics</h1>
-                <p>Daily Report</p>
-            </div>
-            
-            <div style="padding: 20px;">
-                <div class="stats">
-                    <div class="stat">
-                        <div class="stat-number">{stats.get('total_articles', 0):,}</div>
-                        <div class="stat-label">Total Articles</div>
-                    </div>
-                    <div class="stat">
-                        <div class="stat-number">{stats.get('total_authors', 0):,}</div>
-                        <div class="stat-label">Total Authors</div>
-                    </div>
-                    <div class="stat">
-                        <div class="stat-number">{stats.get('avg_score', 0):.2f}</div>
-                        <div class="stat-label">Avg Score</div>
-                    </div>
-                    <div class="stat">
-                        <div class="stat-number">{stats.get('recent_articles', 0):,}</div>
-                        <div class="stat-label">Recent (24h)</div>
-                    </div>
-                </div>
-        """
+        parts = [_ANALYTICS_HTML_HEADER.format(
+            total_articles=stats.get('total_articles', 0),
+            total_authors=stats.get('total_authors', 0),
+            avg_score=stats.get('avg_score', 0),
+            recent_articles=stats.get('recent_articles', 0),
+        )]
         
         # Add top authors
         top_authors = stats.get('top_authors', [])
         if top_authors:
-            html += """
+            parts.append("""
                 <div class="section">
                     <h2>🏆 Top Authors</h2>
-            """
+            """)
             for i, author in enumerate(top_authors[:5], 1):
-                html += f"""
+                parts.append(f"""
                     <div style="padding: 10px; border-bottom: 1px solid #eee;">
-                        {i}. @{author['username']} - {author['followers_count']:,} followers
+                        {i}. @{html.escape(author['username'])} - {author['followers_count']:,} followers
                     </div>
-                """
-            html += "</div>"
+                """)
+            parts.append("</div>")
         
         # Add trending topics
         trending_topics = stats.get('trending_topics', [])
         if trending_topics:
-            html += """
+            parts.append("""
                 <div class="section">
                     <h2>🔥 Trending Topics</h2>
-            """
+            """)
             for i, topic in enumerate(trending_topics[:5], 1):
-                html += f"""
+                parts.append(f"""
                     <div style="padding: 10px; border-bottom: 1px solid #eee;">
-                        {i}. {topic['name']} - {topic['frequency']} mentions
+                        {i}. {html.escape(topic['name'])} - {topic['frequency']} mentions
                     </div>
-                """
-            html += "</div>"
-        
-        html += f"""
-            </div>
-            
-            <div class="footer">
-                <p>Robotics Radar - Automated robotics content curation</p>
-                <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-        </body>
-        </html>
-        """
+                """)
+            parts.append("</div>")
         
-        return html
+        parts.append(_HTML_FOOTER.format(generated_at=generated_at))
+        return "".join(parts)
     
-    def _create_analytics_text(self, stats: Dict) -> str:
+    def _create_analytics_text(self, stats: Dict, generated_at: str) -> str:
         """Create plain text content for analytics report.
         
         Args:
             stats: Analytics statistics
+            generated_at: Formatted timestamp shown in the footer
             
         Returns:
             Plain text content string
         """
-        text = "📊 Robotics Radar - Daily Analytics Report\n"
-        text += "=" * 50 + "\n\n"
-        
-        text += f"📈 Total Articles: {stats.get('total_articles', 0):,}\n"
-        text += f"👥 Total Authors: {stats.get('total_authors', 0):,}\n"
-        text += f"⭐ Average Score: {stats.get('avg_score', 0):.2f}\n"
-        text += f"🕐 Recent Articles (24h): {stats.get('recent_articles', 0):,}\n\n"
+        parts = [
+            "📊 Robotics Radar - Daily Analytics Report\n",
+            "=" * 50 + "\n\n",
+            f"📈 Total Articles: {stats.get('total_articles', 0):,}\n",
+            f"👥 Total Authors: {stats.get('total_authors', 0):,}\n",
+            f"⭐ Average Score: {stats.get('avg_score', 0):.2f}\n",
+            f"🕐 Recent Articles (24h): {stats.get('recent_articles', 0):,}\n\n",
+        ]
         
         # Add top authors
         top_authors = stats.get('top_authors', [])
         if top_authors:
-            text += "🏆 Top Authors:\n"
+            parts.append("🏆 Top Authors:\n")
             for i, author in enumerate(top_authors[:5], 1):
-                text += f"{i}. @{author['username']} ({author['followers_count']:,} followers)\n"
-            text += "\n"
+                parts.append(f"{i}. @{author['username']} ({author['followers_count']:,} followers)\n")
+            parts.append("\n")
         
         # Add trending topics
         trending_topics = stats.get('trending_topics', [])
         if trending_topics:
-            text += "🔥 Trending Topics:\n"
+            parts.append("🔥 Trending Topics:\n")
             for i, topic in enumerate(trending_topics[:5], 1):
-                text += f"{i}. {topic['name']} ({topic['frequency']} mentions)\n"
+                parts.append(f"{i}. {topic['name']} ({topic['frequency']} mentions)\n")
         
-        text += f"\nGenerated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        return text
+        parts.append(f"\nGenerated on {generated_at}")
+        return "".join(parts)
 
 
 def main():
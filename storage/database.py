@@ -5,6 +5,7 @@ Handles SQLite database initialization, schema, and CRUD operations.
 
 import sqlite3
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
@@ -52,6 +53,36 @@ class Feedback:
     feedback_type: str  # 'like', 'dislike', 'rating_1', 'rating_2', etc.
     created_at: datetime
 
+@dataclass
+class DashboardBundle:
+    """Data class for the aggregate data shown on the analytics dashboard."""
+    analytics_summary: Dict
+    trending_topics: List[Dict]
+    top_authors: List[Dict]
+    feedback_stats: Dict
+    engagement_trends: List[Dict]
+    content_categories: List[Dict]
+    review_status: List[Dict]
+
+class _SharedConnection:
+    """Hands an already open connection to ``with get_connection()`` blocks.
+    
+    Leaving the block neither commits nor closes, so several queries can run
+    inside one read transaction opened by the caller.
+    """
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+    
+    def __enter__(self) -> sqlite3.Connection:
+        return self._conn
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+    
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
 class DatabaseManager:
     """Manages SQLite database operations for Robotics Radar."""
     
@@ -62,6 +93,8 @@ class DatabaseManager:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        # Connection shared by the queries of get_dashboard_bundle, per thread
+        self._local = threading.local()
         self.init_database()
     
     def get_connection(self) -> sqlite3.Connection:
@@ -70,6 +103,10 @@ class DatabaseManager:
         Returns:
             SQLite connection object
         """
+        shared = getattr(self._local, 'conn', None)
+        if shared is not None:
+            return _SharedConnection(shared)
+        
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row  # Enable column access by name
         return conn
@@ -831,6 +868,40 @@ class DatabaseManager:
             logger.error(f"Error getting articles with review status: {e}")
             return []
     
+    def get_dashboard_bundle(self, days: int = 7, limit_topics: int = 20,
+                             limit_authors: int = 10) -> DashboardBundle:
+        """Get all aggregate dashboard data in one call.
+        
+        Every section is read over a single connection inside one read
+        transaction, so the queries see the same snapshot and pay for one
+        connection open instead of one per getter.
+        
+        Args:
+            days: Number of days of engagement trends
+            limit_topics: Number of trending topics to return
+            limit_authors: Number of top authors to return
+            
+        Returns:
+            DashboardBundle with every dashboard aggregate
+        """
+        conn = self.get_connection()
+        try:
+            conn.execute("BEGIN")
+            self._local.conn = conn
+            return DashboardBundle(
+                analytics_summary=self.get_analytics_summary(),
+                trending_topics=self.get_trending_topics(limit=limit_topics),
+                top_authors=self.get_top_authors(limit=limit_authors),
+                feedback_stats=self.get_feedback_stats(),
+                engagement_trends=self.get_engagement_trends(days=days),
+                content_categories=self.get_content_categories(),
+                review_status=self.get_articles_with_review_status()
+            )
+        finally:
+            self._local.conn = None
+            conn.rollback()
+            conn.close()
+    
     def get_diverse_articles(self, limit: int = 10) -> List[Article]:
         """Get diverse articles mixing high-score and recent articles.
         
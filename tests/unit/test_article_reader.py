@@ -0,0 +1,86 @@
+"""
+Unit tests for charset detection in the article reader.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from agent_integration import article_reader
+from agent_integration.article_reader import _sniff_charset
+
+
+class TestSniffCharset(unittest.TestCase):
+    """Encoding guesses for pages that declare no charset."""
+    
+    PAGE = ('<html><body><p>' + 'Робототехника и автоматизация. ' * 200 + '</p></body></html>').encode('utf-8')
+    
+    def test_utf8_page(self):
+        """A complete UTF-8 page is detected as UTF-8."""
+        self.assertEqual(_sniff_charset(self.PAGE), 'utf-8')
+    
+    def test_utf8_page_truncated_mid_character(self):
+        """A body cut inside a multibyte character (size-capped read) is still UTF-8."""
+        cut = self.PAGE.index('Р'.encode('utf-8'), 100) + 1
+        truncated = self.PAGE[:cut]
+        with self.assertRaises(UnicodeDecodeError):
+            truncated.decode('utf-8')
+        self.assertEqual(_sniff_charset(truncated), 'utf-8')
+    
+    def test_invalid_utf8_is_not_utf8(self):
+        """Bytes that are invalid UTF-8 before the end of the body are not accepted as UTF-8."""
+        page = ('<p>' + 'Robotique et automatisation, élève ' * 50 + '</p>').encode('cp1252')
+        self.assertNotEqual(_sniff_charset(page), 'utf-8')
+
+
+
+class TestTopicCache(unittest.TestCase):
+    """Process-wide topic cache keyed by content digest."""
+    
+    def setUp(self):
+        """Start from an empty cache with a stub extractor."""
+        article_reader._topic_cache.clear()
+        self.addCleanup(article_reader._topic_cache.clear)
+        self.extractor = MagicMock()
+        self.extractor.extract_topics.side_effect = lambda content: [f"topic_{len(content)}"]
+        extractor_patch = patch.object(article_reader, '_shared_keyword_extractor', return_value=self.extractor)
+        extractor_patch.start()
+        self.addCleanup(extractor_patch.stop)
+    
+    def test_topics_cached_per_content(self):
+        """Repeated content is extracted once and returned as the same tuple."""
+        body = "Robot arm " * 1000
+        first = article_reader._topics_for_content(body)
+        second = article_reader._topics_for_content(body)
+        
+        self.assertEqual(first, ('topic_10000',))
+        self.assertIs(first, second)
+        self.extractor.extract_topics.assert_called_once_with(body)
+    
+    def test_cache_holds_digests_not_bodies(self):
+        """Keys are 16-byte digests, so cached entries never keep article text alive."""
+        article_reader._topics_for_content("x" * 100_000)
+        
+        self.assertEqual([len(key) for key in article_reader._topic_cache], [16])
+        self.assertTrue(all(isinstance(key, bytes) for key in article_reader._topic_cache))
+    
+    def test_cache_is_bounded(self):
+        """The least recently used entry is evicted beyond TOPIC_CACHE_SIZE."""
+        with patch.object(article_reader, 'TOPIC_CACHE_SIZE', 2):
+            for body in ("a", "bb", "a", "ccc"):
+                article_reader._topics_for_content(body)
+            
+            self.assertEqual(len(article_reader._topic_cache), 2)
+            article_reader._topics_for_content("a")  # still cached: used more recently than "bb"
+            article_reader._topics_for_content("bb")  # evicted, extracted again
+        
+        extracted = [call.args[0] for call in self.extractor.extract_topics.call_args_list]
+        self.assertEqual(extracted, ["a", "bb", "ccc", "bb"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,248 @@
+"""
+Unit tests for SMTP connection pooling in the email notifier.
+"""
+
+import asyncio
+import gc
+import os
+import smtplib
+import sys
+import unittest
+import weakref
+from email.mime.text import MIMEText
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from notifier import email_sender
+from notifier.email_sender import EmailNotifier
+
+SMTP_ENV = {
+    'SMTP_SERVER': 'smtp.example.com',
+    'SMTP_PORT': '587',
+    'SMTP_USERNAME': 'radar@example.com',
+    'SMTP_PASSWORD': 'secret',
+    'EMAIL_RECIPIENTS': 'a@example.com, b@example.com',
+}
+
+
+def _make_message(recipient: str) -> MIMEText:
+    message = MIMEText(f"Hello {recipient}")
+    message['Subject'] = 'Test'
+    message['From'] = SMTP_ENV['SMTP_USERNAME']
+    message['To'] = recipient
+    return message
+
+
+class TestSMTPConnectionPool(unittest.TestCase):
+    """Connection reuse, rotation and retries with a mocked smtplib.SMTP."""
+    
+    def setUp(self):
+        """Patch the SMTP client so every connection is a recorded mock."""
+        self.connections = []
+        
+        def connect(*args, **kwargs):
+            conn = MagicMock(name=f"smtp{len(self.connections)}")
+            conn.noop.return_value = (250, b'OK')
+            self.connections.append(conn)
+            return conn
+        
+        env_patch = patch.dict(os.environ, SMTP_ENV)
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+        
+        smtp_patch = patch.object(email_sender.smtplib, 'SMTP', side_effect=connect)
+        self.smtp_class = smtp_patch.start()
+        self.addCleanup(smtp_patch.stop)
+        
+        self.notifier = EmailNotifier()
+        self.addCleanup(self.notifier.close)
+    
+    def _bulk(self, count: int):
+        return [(f"r{i}@example.com", _make_message(f"r{i}@example.com")) for i in range(count)]
+    
+    def test_connection_reused_between_sends(self):
+        """Consecutive emails share one logged-in connection, probed with NOOP."""
+        self.assertTrue(self.notifier._send_email(_make_message('a@example.com')))
+        self.assertTrue(self.notifier._send_email(_make_message('a@example.com')))
+        
+        self.assertEqual(len(self.connections), 1)
+        conn = self.connections[0]
+        conn.starttls.assert_called_once()
+        conn.login.assert_called_once_with('radar@example.com', 'secret')
+        conn.noop.assert_called_once()
+        self.assertEqual(conn.send_message.call_count, 2)
+    
+    def test_bulk_rotates_connection(self):
+        """send_bulk replaces the connection every SMTP_MAX_MESSAGES_PER_CONNECTION messages."""
+        with patch.object(email_sender, 'SMTP_MAX_MESSAGES_PER_CONNECTION', 3):
+            sent = self.notifier.send_bulk(self._bulk(7))
+        
+        self.assertEqual(sent, 7)
+        self.assertEqual([conn.send_message.call_count for conn in self.connections], [3, 3, 1])
+        for conn in self.connections[:2]:
+            conn.quit.assert_called_once()
+        
+        # Each message goes to its own envelope recipient
+        first_call = self.connections[0].send_message.call_args_list[0]
+        self.assertEqual(first_call.kwargs['to_addrs'], ['r0@example.com'])
+    
+    def test_bulk_probes_only_first_message(self):
+        """Back-to-back bulk messages skip the NOOP liveness probe."""
+        self.notifier._send_email(_make_message('a@example.com'))
+        self.notifier.send_bulk(self._bulk(5))
+        
+        self.assertEqual(len(self.connections), 1)
+        self.connections[0].noop.assert_called_once()
+    
+    def test_retry_once_on_disconnect(self):
+        """A connection dropped mid-send is replaced and the message resent once."""
+        self.notifier._send_email(_make_message('a@example.com'))
+        self.connections[0].send_message.side_effect = smtplib.SMTPServerDisconnected("gone")
+        
+        self.assertTrue(self.notifier._send_email(_make_message('a@example.com')))
+        self.assertEqual(len(self.connections), 2)
+        self.assertEqual(self.connections[1].send_message.call_count, 1)
+    
+    def test_second_disconnect_fails_send(self):
+        """The resend is attempted only once."""
+        def connect_dropping(*args, **kwargs):
+            conn = MagicMock()
+            conn.send_message.side_effect = smtplib.SMTPServerDisconnected("gone")
+            self.connections.append(conn)
+            return conn
+        
+        self.smtp_class.side_effect = connect_dropping
+        self.assertFalse(self.notifier._send_email(_make_message('a@example.com')))
+        self.assertEqual(len(self.connections), 2)
+    
+    def test_failed_recipient_does_not_abort_batch(self):
+        """A refused recipient is skipped and the rest of the batch is delivered."""
+        def send_message(message, to_addrs=None):
+            if to_addrs == ['r1@example.com']:
+                raise smtplib.SMTPRecipientsRefused({'r1@example.com': (550, b'No such user')})
+        
+        self.notifier._send_email(_make_message('a@example.com'))
+        self.connections[0].send_message.side_effect = send_message
+        
+        sent = self.notifier.send_bulk(self._bulk(4))
+        
+        self.assertEqual(sent, 3)
+        self.assertEqual(len(self.connections), 1)
+        attempted = [call.kwargs['to_addrs'] for call in self.connections[0].send_message.call_args_list]
+        self.assertEqual(attempted[1:], [[f"r{i}@example.com"] for i in range(4)])
+    
+    def test_failure_mid_batch_reprobes_connection(self):
+        """After a failed message the connection is probed again, and replaced if it is unusable."""
+        def send_message(message, to_addrs=None):
+            if to_addrs == ['r1@example.com']:
+                raise smtplib.SMTPDataError(451, b'Timeout during DATA')
+        
+        self.notifier._send_email(_make_message('a@example.com'))
+        first = self.connections[0]
+        first.send_message.side_effect = send_message
+        first.noop.side_effect = [(250, b'OK'), smtplib.SMTPServerDisconnected("gone")]
+        
+        sent = self.notifier.send_bulk(self._bulk(4))
+        
+        self.assertEqual(sent, 3)
+        self.assertEqual(first.noop.call_count, 2)
+        self.assertEqual(len(self.connections), 2)
+        resent = [call.kwargs['to_addrs'] for call in self.connections[1].send_message.call_args_list]
+        self.assertEqual(resent, [['r2@example.com'], ['r3@example.com']])
+    
+    def test_implicit_tls_on_port_465(self):
+        """Port 465 defaults to SMTP_SSL instead of STARTTLS."""
+        with patch.dict(os.environ, {'SMTP_PORT': '465'}), \
+                patch.object(email_sender.smtplib, 'SMTP_SSL') as smtp_ssl:
+            notifier = EmailNotifier()
+            self.assertTrue(notifier.smtp_use_ssl)
+            notifier._send_email(_make_message('a@example.com'))
+        
+        smtp_ssl.assert_called_once()
+        smtp_ssl.return_value.starttls.assert_not_called()
+        self.assertEqual(self.connections, [])
+    
+    def test_notifier_can_be_garbage_collected(self):
+        """The exit hook does not keep notifiers alive."""
+        notifier = EmailNotifier()
+        ref = weakref.ref(notifier)
+        del notifier
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+
+@unittest.skipIf(email_sender.aiosmtplib is None, "aiosmtplib is not installed")
+class TestAsyncSMTPConnectionPool(unittest.TestCase):
+    """Async connection reuse across event loops with a mocked aiosmtplib.SMTP."""
+    
+    def setUp(self):
+        """Patch the async SMTP client so every connection is a recorded mock."""
+        self.connections = []
+        
+        def connect(*args, **kwargs):
+            conn = MagicMock(name=f"asmtp{len(self.connections)}")
+            for method in ('connect', 'login', 'send_message', 'quit'):
+                setattr(conn, method, AsyncMock())
+            conn.noop = AsyncMock(return_value=MagicMock(code=250))
+            conn.is_connected = True
+            self.connections.append(conn)
+            return conn
+        
+        env_patch = patch.dict(os.environ, SMTP_ENV)
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+        
+        smtp_patch = patch.object(email_sender.aiosmtplib, 'SMTP', side_effect=connect)
+        smtp_patch.start()
+        self.addCleanup(smtp_patch.stop)
+        
+        self.notifier = EmailNotifier()
+    
+    def test_connection_reused_within_loop(self):
+        """Sends on one event loop share a connection until aclose."""
+        async def send_twice():
+            await self.notifier._asend_email(_make_message('a@example.com'))
+            await self.notifier._asend_email(_make_message('a@example.com'))
+            await self.notifier.aclose()
+        
+        asyncio.run(send_twice())
+        
+        self.assertEqual(len(self.connections), 1)
+        self.assertEqual(self.connections[0].send_message.await_count, 2)
+        self.connections[0].quit.assert_awaited_once()
+    
+    def test_connection_from_finished_loop_is_closed(self):
+        """A new event loop closes the connection left open by the previous one."""
+        asyncio.run(self.notifier._asend_email(_make_message('a@example.com')))
+        asyncio.run(self.notifier._asend_email(_make_message('a@example.com')))
+        
+        self.assertEqual(len(self.connections), 2)
+        self.connections[0].close.assert_called_once()
+        self.connections[1].close.assert_not_called()
+    
+    def test_closed_loop_shuts_socket_down(self):
+        """When the old loop cannot close the transport, the socket is shut down."""
+        asyncio.run(self.notifier._asend_email(_make_message('a@example.com')))
+        old = self.connections[0]
+        old.close.side_effect = RuntimeError("Event loop is closed")
+        sock = old.transport.get_extra_info.return_value
+        
+        asyncio.run(self.notifier._asend_email(_make_message('a@example.com')))
+        
+        old.transport.get_extra_info.assert_called_once_with('socket')
+        sock.shutdown.assert_called_once_with(email_sender.socket.SHUT_RDWR)
+    
+    def test_exit_hook_closes_async_connection(self):
+        """Connections never passed to aclose are closed at exit."""
+        asyncio.run(self.notifier._asend_email(_make_message('a@example.com')))
+        
+        email_sender._close_open_notifiers()
+        
+        self.connections[0].close.assert_called_once()
+        self.assertIsNone(self.notifier._aconn)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,262 @@
+"""
+Unit tests for tokenization, rule-based matching and summaries in the keyword extractor.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import ExitStack
+from unittest.mock import patch
+
+import spacy
+from spacy.language import Language
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from nlp import keyword_extraction
+from nlp.keyword_extraction import KeywordExtractor
+
+
+class TestRelevanceConfig(unittest.TestCase):
+    """is_robotics_related with keyword configs lacking exclude keywords."""
+    
+    ROBOTICS_TEXT = "New robot research paper on robotics experiment algorithm"
+    
+    def setUp(self):
+        """Create a scratch directory for config files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.extractor = KeywordExtractor(model_name="missing_test_model")
+        
+    def tearDown(self):
+        """Remove config files and drop configs cached by path."""
+        keyword_extraction._load_relevance_keywords.cache_clear()
+        self.tmpdir.cleanup()
+    
+    def _write_config(self, name: str, content: str) -> str:
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, 'w') as file:
+            file.write(content)
+        return path
+    
+    def _check_configs(self):
+        configs = {
+            'missing': "keywords: [robot, robotics]\n",
+            'empty': "keywords: [robot, robotics]\nexclude_keywords: []\n",
+            'null': "keywords: [robot, robotics]\nexclude_keywords:\n",
+        }
+        for name, content in configs.items():
+            with self.subTest(exclude_keywords=name):
+                path = self._write_config(f"{name}.yaml", content)
+                self.assertTrue(self.extractor.is_robotics_related(self.ROBOTICS_TEXT, path))
+                self.assertFalse(self.extractor.is_robotics_related("Weather is sunny today", path))
+        
+        with self.subTest(keywords='empty'):
+            path = self._write_config("no_keywords.yaml", "keywords: []\nexclude_keywords: [sunny]\n")
+            self.assertFalse(self.extractor.is_robotics_related(self.ROBOTICS_TEXT, path))
+    
+    def test_missing_or_empty_exclude_keywords(self):
+        """A config without exclude keywords still accepts robotics texts."""
+        self._check_configs()
+    
+    def test_missing_or_empty_exclude_keywords_without_automaton(self):
+        """Same results on the substring fallback used without pyahocorasick."""
+        with patch.object(keyword_extraction, 'ahocorasick', None):
+            self._check_configs()
+    
+    def test_exclude_keywords_reject(self):
+        """A configured exclude keyword vetoes an otherwise relevant text."""
+        path = self._write_config("exclude.yaml", "keywords: [robot]\nexclude_keywords: [crypto]\n")
+        self.assertTrue(self.extractor.is_robotics_related(self.ROBOTICS_TEXT, path))
+        self.assertFalse(self.extractor.is_robotics_related(self.ROBOTICS_TEXT + " crypto", path))
+
+
+class TestEmptyPatternAutomaton(unittest.TestCase):
+    """Automaton builders with no patterns."""
+    
+    def test_no_patterns_builds_no_automaton(self):
+        """An empty pattern list yields None so callers use the substring fallback."""
+        self.assertIsNone(keyword_extraction._build_pattern_automaton())
+        self.assertIsNone(keyword_extraction._build_pattern_automaton(()))
+        self.assertFalse(keyword_extraction._contains_any("robot", (), None))
+
+
+# (text, tokens) as produced by stripping URLs, then mentions and hashtags, then
+# finding words of three or more letters
+TOKEN_CASES = [
+    ("Visit https://x.y or @bob #tag now", ['visit', 'now']),
+    ("robotics www.example.com arm", ['robotics', 'arm']),
+    ("awwwesome", []),  # 'www' starts a URL mid-word
+    ("abhttp://x", []),
+    ("abcwww", ['abcwww']),  # 'www' needs a following character
+    ("#tag@bob http", ['http']),
+    ("#hphttp://x robot", ['robot']),  # URL stripped before the hashtag
+    ("Robot ARM, 3D robot-arm", ['robot', 'arm', 'robot', 'arm']),
+]
+
+
+class TestKeywordTokenizer(unittest.TestCase):
+    """KEYWORD_TOKEN_RE against the strip-then-find tokenization it replaced."""
+    
+    def test_tokens(self):
+        """URLs, mentions and hashtags are skipped wherever they start."""
+        for text, expected in TOKEN_CASES:
+            with self.subTest(text=text):
+                tokens = [word.lower() for word in keyword_extraction.KEYWORD_TOKEN_RE.findall(text) if word]
+                self.assertEqual(tokens, expected)
+    
+    def test_basic_keyword_extraction(self):
+        """Mid-word URLs do not leak keywords into the basic extractor."""
+        extractor = KeywordExtractor(model_name="missing_test_model")
+        self.assertEqual(
+            extractor._basic_keyword_extraction("awwwesome robot abhttp://x robot arm"),
+            ['robot', 'arm']
+        )
+
+
+# (text, categories, topics), as produced by the original substring-scanning implementation
+MATCHING_CASES = [
+    ("Surgical robot helps hospital patients recover after surgery and rehabilitation therapy",
+     ['medical_robotics'], ['medical_robotics']),
+    ("Autonomous vehicle startup tests self-driving cars on city streets",
+     ['autonomous_vehicles'], ['autonomous_vehicles', 'business_development', 'autonomous_systems']),
+    ("Factory automation: industrial robots speed up manufacturing and assembly lines",
+     ['industrial_automation'], ['industrial_automation', 'industrial_robotics']),
+    ("New robot research paper on robotics experiment algorithm",
+     ['research_robotics', 'robotics_software'], ['research_publication', 'robotics_research']),
+    ("Deep learning model improves robot perception with camera and sensor fusion",
+     ['educational_robotics', 'robotics_hardware', 'ai_robotics'],
+     ['educational_robotics', 'deep_learning', 'computer_vision', 'machine_learning']),
+    ("Swarm robotics study shows collective behavior in multi-robot coordination",
+     ['autonomous_vehicles', 'swarm_robotics', 'research_robotics'], ['swarm_robotics', 'research_publication']),
+    ("Humanoid robot walks with bipedal gait",
+     ['humanoid_robotics', 'ai_robotics'], ['robotics_general', 'artificial_intelligence']),
+    ("Drone delivery with mobile robot fleets",
+     ['aerial_robotics', 'mobile_robotics'], ['aerial_robotics', 'mobile_robotics']),
+    ("Robot startup raises funding", ['ai_robotics'], ['business_development']),
+    ("The weather is sunny today and the market is up", ['robotics_general'], ['robotics_general']),
+    ("", ['robotics_general'], ['robotics_general']),
+]
+
+# (text, is_robotics_related) against RELEVANCE_CONFIG
+RELEVANCE_CASES = [
+    ("Surgical robot helps hospital patients recover after surgery and rehabilitation therapy", True),
+    ("Drone delivery with mobile robot fleets", True),
+    ("Self-driving robot taxi buys crypto", False),  # exclude keyword vetoes
+    ("The weather is sunny today and the market is up", False),  # no include keyword
+    ("Robot chef cooks pasta", False),  # only the general fallback topic
+    ("Robot startup raises funding", False),  # only non-robotics topics
+]
+
+RELEVANCE_CONFIG = "keywords:\n  - Robot\n  - drone\n  - self-driving\nexclude_keywords:\n  - Crypto\n"
+
+
+class TestRuleMatching(unittest.TestCase):
+    """Category, topic and relevance matching, with and without pyahocorasick."""
+    
+    def setUp(self):
+        """Create the extractor and a keywords config."""
+        self.extractor = KeywordExtractor(model_name="missing_test_model")
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmpdir.name, "keywords.yaml")
+        with open(self.config_path, 'w') as file:
+            file.write(RELEVANCE_CONFIG)
+        
+    def tearDown(self):
+        """Remove the config and drop configs cached by path."""
+        keyword_extraction._load_relevance_keywords.cache_clear()
+        self.tmpdir.cleanup()
+    
+    def _without_automata(self):
+        """Patch every automaton away so the substring fallbacks run."""
+        stack = ExitStack()
+        for name in ('ahocorasick', 'CATEGORY_AUTOMATON', 'TOPIC_AUTOMATON'):
+            stack.enter_context(patch.object(keyword_extraction, name, None))
+        return stack
+    
+    def _check_cases(self):
+        for text, categories, topics in MATCHING_CASES:
+            with self.subTest(text=text):
+                self.assertEqual(self.extractor.extract_categories(text), categories)
+                self.assertEqual(self.extractor.extract_topics(text), topics)
+        for text, expected in RELEVANCE_CASES:
+            with self.subTest(text=text):
+                self.assertEqual(self.extractor.is_robotics_related(text, self.config_path), expected)
+    
+    def test_matching_with_automata(self):
+        """Pinned outputs on the Aho-Corasick path."""
+        if keyword_extraction.TOPIC_AUTOMATON is None:
+            self.skipTest("pyahocorasick is not installed")
+        self._check_cases()
+    
+    def test_matching_without_automata(self):
+        """Pinned outputs on the substring fallback."""
+        with self._without_automata():
+            self._check_cases()
+    
+    def test_patterns_match_as_substrings(self):
+        """Single-word patterns match inside longer words ('av' in 'aviation')."""
+        for patch_automata in (False, True):
+            with self.subTest(without_automata=patch_automata):
+                with self._without_automata() if patch_automata else ExitStack():
+                    self.assertEqual(
+                        self.extractor.extract_categories("Aviation startup raises funds"),
+                        ['autonomous_vehicles', 'ai_robotics']
+                    )
+    
+    def test_robotics_topics_need_two_distinct_keywords(self):
+        """A robotics topic needs two different keywords; repeats of one do not count."""
+        cases = [
+            ("Algorithm algorithm algorithm", False),
+            ("Autonomous shuttle pilot", False),
+            ("Autonomous vehicle pilot", True),  # 'autonomous' and 'autonomous vehicle'
+            ("A study on a new algorithm", True),
+        ]
+        for patch_automata in (False, True):
+            for text, expected in cases:
+                with self.subTest(text=text, without_automata=patch_automata):
+                    with self._without_automata() if patch_automata else ExitStack():
+                        topics = self.extractor.extract_topics(text)
+                    has_topic = bool({'robotics_research', 'autonomous_systems'} & set(topics))
+                    self.assertEqual(has_topic, expected, topics)
+
+
+
+@Language.component("case_tagger")
+def _case_tagger(doc):
+    """Stand-in tagger: capitalized words are proper nouns, other words nouns lemmatized to the singular."""
+    for token in doc:
+        if token.is_alpha:
+            if token.text[0].isupper():
+                token.pos_, token.lemma_ = 'PROPN', token.text
+            else:
+                token.pos_, token.lemma_ = 'NOUN', token.text.rstrip('s')
+    return doc
+
+
+class TestContentSummaryKeywords(unittest.TestCase):
+    """analyze_many keywords agree with extract_keywords."""
+    
+    TEXTS = [
+        "Boston Dynamics shows the Atlas robot doing parkour",
+        "NASA tests a Mars rover arm; the rover arm grips rocks",
+    ]
+    
+    def setUp(self):
+        """Use a blank pipeline whose tags and lemmas depend on case."""
+        self.extractor = KeywordExtractor(model_name="missing_test_model")
+        self.extractor.nlp = spacy.blank("en")
+        self.extractor.nlp.add_pipe("case_tagger", name="tagger")
+    
+    def test_keywords_match_extract_keywords(self):
+        """Summaries use the same lowercased parse as extract_keywords."""
+        summaries = self.extractor.analyze_many(self.TEXTS)
+        for text, summary in zip(self.TEXTS, summaries):
+            with self.subTest(text=text):
+                self.assertEqual(summary['keywords'], self.extractor.extract_keywords(text))
+                self.assertEqual(self.extractor.get_content_summary(text)['keywords'], summary['keywords'])
+        self.assertIn('dynamic', summaries[0]['keywords'])
+
+if __name__ == '__main__':
+    unittest.main()